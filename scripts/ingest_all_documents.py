@@ -21,6 +21,7 @@ import json
 import logging
 import sys
 import shutil
+from collections import Counter
 from pathlib import Path
 
 # Add project root to path
@@ -49,15 +50,17 @@ def ingest_pdfs(indexer: DocumentIndexer, pdf_dir: str = "data/harel_pdfs/pdfs")
     processor = PDFProcessor()
     count = 0
     
-    for pdf_file in sorted(pdf_path.glob("*.pdf")):
-        try:
-            doc = processor.process(str(pdf_file))
-            result = indexer.index_processed_document(doc)
-            if result.success and result.chunk_count > 0:
-                count += 1
-                logger.info(f"  ✓ {pdf_file.name}: {result.chunk_count} chunks")
-        except Exception as e:
-            logger.error(f"  ✗ {pdf_file.name}: {e}")
+    # One registry write for the whole run instead of one per document
+    with indexer.registry.batch():
+        for pdf_file in sorted(pdf_path.glob("*.pdf")):
+            try:
+                doc = processor.process(str(pdf_file))
+                result = indexer.index_processed_document(doc)
+                if result.success and result.chunk_count > 0:
+                    count += 1
+                    logger.info(f"  ✓ {pdf_file.name}: {result.chunk_count} chunks")
+            except Exception as e:
+                logger.error(f"  ✗ {pdf_file.name}: {e}")
     
     return count
 
@@ -73,13 +76,14 @@ def ingest_aspx(indexer: DocumentIndexer, aspx_dir: str = "data/raw/aspx") -> in
     documents = processor.process_all()
     count = 0
     
-    for doc in documents:
-        try:
-            result = indexer.index_processed_document(doc)
-            if result.success and result.chunk_count > 0:
-                count += 1
-        except Exception as e:
-            logger.error(f"  ✗ {doc.filename}: {e}")
+    with indexer.registry.batch():
+        for doc in documents:
+            try:
+                result = indexer.index_processed_document(doc)
+                if result.success and result.chunk_count > 0:
+                    count += 1
+            except Exception as e:
+                logger.error(f"  ✗ {doc.filename}: {e}")
     
     logger.info(f"Ingested {count} ASPX pages")
     return count
@@ -221,6 +225,9 @@ def main():
         logger.info("\n--- Ingesting ASPX Pages ---")
         total_docs += ingest_aspx(indexer)
 
+    # Consolidate appended chunks into chunks.json for the TOC/embedding steps
+    indexer.finalize()
+
     logger.info(f"\nTotal documents ingested: {total_docs}")
     logger.info(f"Total chunks: {len(indexer._chunks_store)}")
 
@@ -242,10 +249,7 @@ def main():
     logger.info(f"Total chunks: {len(indexer._chunks_store)}")
 
     # Show domain breakdown
-    domain_counts = {}
-    for chunk in indexer._chunks_store.values():
-        domain = chunk.get("domain", "unknown")
-        domain_counts[domain] = domain_counts.get(domain, 0) + 1
+    domain_counts = Counter(indexer.get_chunk_columns("domain")["domain"])
 
     logger.info("\nChunks by domain:")
     for domain, count in sorted(domain_counts.items(), key=lambda x: -x[1]):
@@ -146,6 +146,7 @@ def main():
     if args.file:
         result = index_single(indexer, args.file)
         results = [result]
+        indexer.finalize()
     else:
         skip_indexed = not args.all
         results = index_all(indexer, args.dir, skip_indexed=skip_indexed)
@@ -7,6 +7,7 @@ Usage:
     python scripts/run_baseline_evaluation.py
     python scripts/run_baseline_evaluation.py --models gpt-4o --strategies basic,strict_grounding
     python scripts/run_baseline_evaluation.py --no-ragas  # Skip RAGAS metrics (faster)
+    python scripts/run_baseline_evaluation.py --resume    # Reuse answers from an interrupted run
 """
 
 import argparse
@@ -56,6 +57,17 @@ def main():
         action="store_true",
         help="Skip RAGAS metrics (faster but less accurate)",
     )
+    parser.add_argument(
+        "--score-cache",
+        type=str,
+        default=None,
+        help="SQLite file to cache RAGAS scores across runs (e.g. data/evaluation/ragas_cache.sqlite)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse model answers saved in <output-dir>/generations.jsonl by an earlier run",
+    )
     parser.add_argument(
         "--report-only",
         action="store_true",
@@ -92,6 +104,7 @@ def main():
         runner = BaselineRunner(
             models=models,
             strategies=strategies,
+            score_cache_path=args.score_cache,
         )
         
         results = runner.run_evaluation(
@@ -99,8 +112,12 @@ def main():
             output_dir=args.output_dir,
             use_ragas=not args.no_ragas,
             verbose=True,
+            resume=args.resume,
         )
         
+        if args.score_cache:
+            print(f"\nRAGAS score cache: {runner.metrics.cache_hits} hits, {runner.metrics.cache_misses} misses")
+
         print("\n" + "=" * 60)
         print("EVALUATION COMPLETE")
         print("=" * 60)
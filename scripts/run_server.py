@@ -26,6 +26,7 @@ def main():
 ╠══════════════════════════════════════════════════════════════╣
 ║  Endpoints:                                                  ║
 ║    POST /chat          - Send a message                      ║
+║    POST /chat/stream   - Send a message (SSE streaming)      ║
 ║    GET  /health        - Health check                        ║
 ║    GET  /sessions      - List sessions                       ║
 ║    GET  /sessions/{{id}} - Get session details                 ║
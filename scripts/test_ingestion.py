@@ -7,12 +7,12 @@ Tests DocumentRegistry, TopicTaxonomy, and PDFProcessor.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ingestion.document_registry import DocumentRegistry
-from ingestion.topic_taxonomy import TopicTaxonomy
-from ingestion.pdf_processor import PDFProcessor
+from src.ingestion.document_registry import DocumentRegistry
+from src.ingestion.topic_taxonomy import TopicTaxonomy
+from src.ingestion.pdf_processor import PDFProcessor
 
 
 def test_document_registry():
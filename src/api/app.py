@@ -1,11 +1,15 @@
 """FastAPI application for Harel Insurance Chatbot."""
 
+import asyncio
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from .models import (
     ChatRequest, 
@@ -16,7 +20,15 @@ from .models import (
     ErrorResponse,
 )
 from .session_store import session_store
-from .guardrails import validate_input, validate_output, is_insurance_related, get_off_topic_response
+from .guardrails import (
+    validate_input,
+    validate_output,
+    redact_pii,
+    split_streamed_text,
+    MAX_OUTPUT_LENGTH,
+    is_insurance_related,
+    get_off_topic_response,
+)
 from src.rag import RAGPipeline, RAGConfig
 from src.agents import InsuranceAgent
 
@@ -24,15 +36,19 @@ from src.agents import InsuranceAgent
 # Global singletons (lazy loaded)
 _rag_pipeline: Optional[RAGPipeline] = None
 _agent: Optional[InsuranceAgent] = None
+# Singletons are created from worker threads (asyncio.to_thread), so guard init
+_init_lock = threading.Lock()
 
 
 def get_rag_pipeline() -> RAGPipeline:
     """Get or create RAG pipeline singleton."""
     global _rag_pipeline
     if _rag_pipeline is None:
-        print("Initializing RAG pipeline...")
-        _rag_pipeline = RAGPipeline(RAGConfig())
-        print("RAG pipeline ready.")
+        with _init_lock:
+            if _rag_pipeline is None:
+                print("Initializing RAG pipeline...")
+                _rag_pipeline = RAGPipeline(RAGConfig())
+                print("RAG pipeline ready.")
     return _rag_pipeline
 
 
@@ -40,9 +56,12 @@ def get_agent() -> InsuranceAgent:
     """Get or create agent singleton."""
     global _agent
     if _agent is None:
-        print("Initializing Insurance Agent...")
-        _agent = InsuranceAgent(rag_pipeline=get_rag_pipeline())
-        print("Agent ready.")
+        pipeline = get_rag_pipeline()
+        with _init_lock:
+            if _agent is None:
+                print("Initializing Insurance Agent...")
+                _agent = InsuranceAgent(rag_pipeline=pipeline)
+                print("Agent ready.")
     return _agent
 
 
@@ -55,6 +74,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
     )
     
     # CORS middleware
@@ -71,12 +91,12 @@ def create_app() -> FastAPI:
         """Check API and component health."""
         components = {
             "api": "healthy",
-            "sessions": session_store.session_count,
+            "sessions": await asyncio.to_thread(lambda: session_store.session_count),
         }
         
-        # Check RAG pipeline
+        # Check RAG pipeline (first call initializes it, so keep it off the event loop)
         try:
-            pipeline = get_rag_pipeline()
+            await asyncio.to_thread(get_rag_pipeline)
             components["rag_pipeline"] = "healthy"
             components["vector_store"] = "healthy"
         except Exception as e:
@@ -110,20 +130,21 @@ def create_app() -> FastAPI:
         message = input_validation.sanitized_text
 
         # Get or create session
-        session = session_store.get_or_create_session(request.session_id)
+        session = await asyncio.to_thread(session_store.get_or_create_session, request.session_id)
 
         # Add user message to history
-        session.add_message("user", message)
+        await asyncio.to_thread(session.add_message, "user", message)
 
         try:
             # Get RAG pipeline
-            pipeline = get_rag_pipeline()
+            pipeline = await asyncio.to_thread(get_rag_pipeline)
             
             # Get conversation history for context
             history = session.get_history(max_turns=3)
             
-            # Query RAG pipeline
-            result = pipeline.query(
+            # Query RAG pipeline in a worker thread so the event loop keeps serving requests
+            result = await asyncio.to_thread(
+                pipeline.query,
                 question=message,
                 conversation_history=history[:-1],  # Exclude current message
             )
@@ -146,7 +167,7 @@ def create_app() -> FastAPI:
             answer = output_validation.sanitized_text
 
             # Add assistant response to history
-            session.add_message("assistant", answer, [c.dict() for c in citations])
+            await asyncio.to_thread(session.add_message, "assistant", answer, citations)
             
             latency_ms = int((time.time() - start_time) * 1000)
             
@@ -165,41 +186,152 @@ def create_app() -> FastAPI:
                 detail=f"Error processing request: {str(e)}"
             )
     
-    @app.get("/sessions", response_model=list[SessionInfo], tags=["Sessions"])
+    @app.post("/chat/stream", tags=["Chat"])
+    async def chat_stream(request: ChatRequest):
+        """
+        Send a message and stream the response as Server-Sent Events.
+
+        Events (each a `data: {...}` line):
+        - {"type": "token", "content": "..."} for each generated sentence or
+          line, PII-redacted before it is sent; tokens stop once
+          MAX_OUTPUT_LENGTH characters have been sent
+        - {"type": "citation", "citation": {...}} for each source
+        - {"type": "final", "session_id": "...", "answer": "...", "confidence": "..."}
+          where `answer` is exactly the concatenation of the token contents
+        - {"type": "error", "message": "..."} if generation fails mid-stream
+        """
+        # Validate input
+        input_validation = validate_input(request.message)
+        if not input_validation.is_valid:
+            raise HTTPException(status_code=400, detail=input_validation.error_message)
+
+        message = input_validation.sanitized_text
+
+        # Get or create session
+        session = await asyncio.to_thread(session_store.get_or_create_session, request.session_id)
+        await asyncio.to_thread(session.add_message, "user", message)
+
+        try:
+            pipeline = await asyncio.to_thread(get_rag_pipeline)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error processing request: {str(e)}"
+            )
+
+        history = session.get_history(max_turns=3)
+
+        def sse(data: dict) -> str:
+            return f"data: {orjson.dumps(data).decode()}\n\n"
+
+        def event_stream():
+            # Sync generator: Starlette iterates it in a threadpool, so the
+            # blocking retrieval and LLM calls stay off the event loop.
+            sent_parts = []  # Redacted text already sent, in order
+            sent_length = 0
+            pending = ""  # Raw text not yet redacted and sent
+            citations = []
+            answer = None
+
+            def take(segment: str) -> str:
+                """Redact a segment and trim it to the remaining length budget."""
+                nonlocal sent_length
+                remaining = MAX_OUTPUT_LENGTH - sent_length
+                if remaining <= 0:
+                    return ""
+                text = redact_pii(segment)
+                if len(text) > remaining:
+                    text = text[:remaining]
+                sent_parts.append(text)
+                sent_length += len(text)
+                return text
+
+            try:
+                for event_type, payload in pipeline.query_stream(
+                    question=message,
+                    conversation_history=history[:-1],  # Exclude current message
+                ):
+                    if event_type == "token":
+                        if sent_length >= MAX_OUTPUT_LENGTH:
+                            continue
+                        # Never send raw deltas: PII redaction needs whole segments
+                        ready, pending = split_streamed_text(pending + payload)
+                        if ready and (text := take(ready)):
+                            yield sse({"type": "token", "content": text})
+                        continue
+
+                    if pending.strip() and (text := take(pending)):
+                        yield sse({"type": "token", "content": text})
+                    pending = ""
+
+                    if event_type == "citation":
+                        citation = Citation(
+                            source=payload.source_file,
+                            page=payload.page_num,
+                            relevance_score=None,
+                        )
+                        citations.append(citation)
+                        yield sse({"type": "citation", "citation": citation.model_dump()})
+                    elif event_type == "final":
+                        answer = "".join(sent_parts)
+                        if not answer:
+                            answer = "מצטער, לא הצלחתי למצוא תשובה."
+                            yield sse({"type": "token", "content": answer})
+                        yield sse({
+                            "type": "final",
+                            "session_id": session.session_id,
+                            "answer": answer,
+                            "confidence": payload,
+                        })
+            except Exception as e:
+                yield sse({"type": "error", "message": f"Error processing request: {str(e)}"})
+            finally:
+                # Record the assistant turn once the stream closes
+                if answer is None and sent_parts:
+                    answer = "".join(sent_parts)
+                if answer is not None:
+                    session.add_message("assistant", answer, citations)
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    # Read-only internal views: build plain dicts and return them as
+    # ORJSONResponse directly, skipping response-model validation and
+    # jsonable_encoder. SessionInfo is kept for the OpenAPI schema only.
+    @app.get("/sessions", responses={200: {"model": list[SessionInfo]}}, tags=["Sessions"])
     async def list_sessions():
         """List all active sessions."""
-        sessions = session_store.get_all_sessions()
-        return [
-            SessionInfo(
-                session_id=s.session_id,
-                created_at=s.created_at,
-                last_activity=s.last_activity,
-                message_count=s.message_count,
-            )
+        sessions = await asyncio.to_thread(session_store.get_all_sessions)
+        return ORJSONResponse([
+            {
+                "session_id": s.session_id,
+                "created_at": datetime.fromtimestamp(s.created_at, tz=timezone.utc),
+                "last_activity": datetime.fromtimestamp(s.last_activity, tz=timezone.utc),
+                "message_count": s.message_count,
+            }
             for s in sessions
-        ]
+        ])
     
     @app.get("/sessions/{session_id}", tags=["Sessions"])
     async def get_session(session_id: str):
         """Get session details and conversation history."""
-        session = session_store.get_session(session_id)
+        session = await asyncio.to_thread(session_store.get_session, session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        return {
+        return ORJSONResponse({
             "session_id": session.session_id,
-            "created_at": session.created_at,
-            "last_activity": session.last_activity,
+            "created_at": datetime.fromtimestamp(session.created_at, tz=timezone.utc),
+            "last_activity": datetime.fromtimestamp(session.last_activity, tz=timezone.utc),
             "message_count": session.message_count,
             "messages": [
                 {
                     "role": m.role,
                     "content": m.content,
-                    "timestamp": m.timestamp,
+                    "timestamp": datetime.fromtimestamp(m.timestamp, tz=timezone.utc),
                 }
                 for m in session.messages
             ]
-        }
+        })
 
     @app.post("/agent/chat", tags=["Agent"])
     async def agent_chat(request: ChatRequest):
@@ -218,14 +350,15 @@ def create_app() -> FastAPI:
         message = input_validation.sanitized_text
 
         # Get or create session
-        session = session_store.get_or_create_session(request.session_id)
-        session.add_message("user", message)
+        session = await asyncio.to_thread(session_store.get_or_create_session, request.session_id)
+        await asyncio.to_thread(session.add_message, "user", message)
 
         try:
-            agent = get_agent()
+            agent = await asyncio.to_thread(get_agent)
             history = session.get_history(max_turns=3)
 
-            result = agent.chat(
+            result = await asyncio.to_thread(
+                agent.chat,
                 message=message,
                 conversation_history=history[:-1],
             )
@@ -236,7 +369,7 @@ def create_app() -> FastAPI:
             output_validation = validate_output(answer)
             answer = output_validation.sanitized_text
 
-            session.add_message("assistant", answer)
+            await asyncio.to_thread(session.add_message, "assistant", answer)
 
             latency_ms = int((time.time() - start_time) * 1000)
 
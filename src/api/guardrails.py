@@ -43,6 +43,17 @@ INSURANCE_KEYWORDS = [
     "travel", "business", "mortgage", "dental", "accident", "theft", "fire",
 ]
 
+# English keywords are matched as whole tokens so "car" does not hit "card".
+# Hebrew attaches prefixes (ה/ב/ל/ו/ש...) to words, so Hebrew keywords and
+# multi-word phrases are matched as substrings.
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_KEYWORD_TOKENS = frozenset(
+    k.lower() for k in INSURANCE_KEYWORDS if k.isascii() and " " not in k
+)
+_KEYWORD_SUBSTRINGS = tuple(
+    k.lower() for k in INSURANCE_KEYWORDS if k.lower() not in _KEYWORD_TOKENS
+)
+
 # Maximum lengths
 MAX_INPUT_LENGTH = 2000
 MAX_OUTPUT_LENGTH = 5000
@@ -116,18 +127,41 @@ def validate_output(text: str) -> ValidationResult:
         text = text[:MAX_OUTPUT_LENGTH] + "..."
         logger.warning("Output truncated due to length")
     
-    # Remove potential PII patterns (credit card numbers, Israeli ID)
+    return ValidationResult(
+        is_valid=True,
+        sanitized_text=redact_pii(text)
+    )
+
+
+def redact_pii(text: str) -> str:
+    """Mask PII patterns (credit card numbers, Israeli ID, phone numbers)."""
     # Credit card: 16 digits
     text = re.sub(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b', '[מספר כרטיס מוסתר]', text)
     # Israeli ID: 9 digits
     text = re.sub(r'\b\d{9}\b', '[מספר זהות מוסתר]', text)
     # Phone numbers
     text = re.sub(r'\b0\d{1,2}[-\s]?\d{7}\b', '[מספר טלפון מוסתר]', text)
-    
-    return ValidationResult(
-        is_valid=True,
-        sanitized_text=text
-    )
+    return text
+
+
+# Streamed output is released at sentence or line breaks so each segment can
+# be redacted whole. A newline right after a digit is not a break: the PII
+# patterns allow whitespace between digit groups.
+_STREAM_BREAK_RE = re.compile(r"[.!?]\s+|(?<!\d)\n\s*")
+
+
+def split_streamed_text(text: str) -> tuple[str, str]:
+    """
+    Split buffered stream text at its last sentence or line break.
+
+    Returns:
+        (ready, pending): `ready` can be passed to redact_pii() and sent;
+        `pending` should be kept until more text arrives.
+    """
+    end = 0
+    for match in _STREAM_BREAK_RE.finditer(text):
+        end = match.end()
+    return text[:end], text[end:]
 
 
 def is_insurance_related(text: str) -> bool:
@@ -138,7 +172,9 @@ def is_insurance_related(text: str) -> bool:
         True if the text contains insurance-related keywords
     """
     text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in INSURANCE_KEYWORDS)
+    if any(keyword in text_lower for keyword in _KEYWORD_SUBSTRINGS):
+        return True
+    return not _KEYWORD_TOKENS.isdisjoint(_TOKEN_RE.findall(text_lower))
 
 
 def get_off_topic_response() -> str:
@@ -1,37 +1,41 @@
-"""In-memory session store for conversation history."""
+"""Session stores for conversation history (in-memory or Redis-backed)."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Union
+import json
+import os
+import time
 import uuid
 import threading
 
+from .models import Citation
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
     """Single message in conversation."""
     role: str  # "user" or "assistant"
     content: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    citations: list = field(default_factory=list)
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
+    citations: list[Citation] = field(default_factory=list)  # Serialized only at the API edge
 
 
 @dataclass 
 class Session:
     """Conversation session with history."""
     session_id: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    last_activity: datetime = field(default_factory=datetime.utcnow)
+    created_at: float = field(default_factory=time.time)  # Epoch seconds
+    last_activity: float = field(default_factory=time.time)
     messages: list[Message] = field(default_factory=list)
     
-    def add_message(self, role: str, content: str, citations: list = None):
+    def add_message(self, role: str, content: str, citations: list[Citation] = None):
         """Add a message to the conversation."""
         self.messages.append(Message(
             role=role,
             content=content,
             citations=citations or []
         ))
-        self.last_activity = datetime.utcnow()
+        self.last_activity = self.messages[-1].timestamp
     
     def get_history(self, max_turns: int = 5) -> list[dict]:
         """Get recent conversation history for context."""
@@ -43,13 +47,22 @@ class Session:
         return len(self.messages)
 
 
+@dataclass(slots=True)
+class SessionSummary:
+    """Session metadata for listings, without the message history."""
+    session_id: str
+    created_at: float
+    last_activity: float
+    message_count: int
+
+
 class SessionStore:
     """Thread-safe in-memory session store."""
     
     def __init__(self, ttl_minutes: int = 60, max_sessions: int = 1000):
         self._sessions: dict[str, Session] = {}
         self._lock = threading.Lock()
-        self._ttl = timedelta(minutes=ttl_minutes)
+        self._ttl_seconds = ttl_minutes * 60
         self._max_sessions = max_sessions
     
     def create_session(self) -> Session:
@@ -75,7 +88,7 @@ class SessionStore:
                 return None
             
             # Check if expired
-            if datetime.utcnow() - session.last_activity > self._ttl:
+            if time.time() - session.last_activity > self._ttl_seconds:
                 del self._sessions[session_id]
                 return None
             
@@ -92,10 +105,10 @@ class SessionStore:
     
     def _cleanup_expired(self):
         """Remove expired sessions (called with lock held)."""
-        now = datetime.utcnow()
+        now = time.time()
         expired = [
             sid for sid, session in self._sessions.items()
-            if now - session.last_activity > self._ttl
+            if now - session.last_activity > self._ttl_seconds
         ]
         for sid in expired:
             del self._sessions[sid]
@@ -113,6 +126,189 @@ class SessionStore:
             return len(self._sessions)
 
 
+@dataclass
+class RedisSession(Session):
+    """Session whose new messages are written through to Redis."""
+    store: Optional["RedisSessionStore"] = field(default=None, repr=False, compare=False)
+
+    def add_message(self, role: str, content: str, citations: list[Citation] = None):
+        """Add a message to the conversation and persist it."""
+        super().add_message(role, content, citations)
+        if self.store is not None:
+            self.store._append_message(self, self.messages[-1])
+
+
+class RedisSessionStore:
+    """
+    Redis-backed session store, shared across API worker processes.
+
+    Layout:
+        session:{id}       hash with created_at / last_activity
+        session:{id}:msgs  list of JSON-encoded messages
+        sessions:active    sorted set of session ids scored by expiry time
+
+    Both per-session keys carry a TTL that is refreshed on every write, so
+    expiry is handled by Redis instead of a Python-side sweep. The active
+    index lets count/listing avoid a keyspace SCAN; members whose score has
+    passed are trimmed lazily when it is read.
+    """
+
+    KEY_PREFIX = "session:"
+    ACTIVE_KEY = "sessions:active"
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        ttl_minutes: int = 60,
+        max_connections: int = 50,
+    ):
+        import redis
+
+        url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        pool = redis.ConnectionPool.from_url(
+            url, max_connections=max_connections, decode_responses=True
+        )
+        self._redis = redis.Redis(connection_pool=pool)
+        self._ttl_seconds = ttl_minutes * 60
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    def _msgs_key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}:msgs"
+
+    def create_session(self) -> RedisSession:
+        """Create a new session."""
+        session = RedisSession(session_id=str(uuid.uuid4()), store=self)
+        key = self._key(session.session_id)
+
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping={
+            "created_at": session.created_at,
+            "last_activity": session.last_activity,
+        })
+        pipe.expire(key, self._ttl_seconds)
+        pipe.zadd(self.ACTIVE_KEY, {session.session_id: session.last_activity + self._ttl_seconds})
+        pipe.execute()
+
+        return session
+
+    def get_session(self, session_id: str) -> Optional[RedisSession]:
+        """Get existing session or None if not found/expired."""
+        pipe = self._redis.pipeline()
+        pipe.hgetall(self._key(session_id))
+        pipe.lrange(self._msgs_key(session_id), 0, -1)
+        meta, raw_messages = pipe.execute()
+        return self._build_session(session_id, meta, raw_messages)
+
+    def _build_session(
+        self, session_id: str, meta: dict, raw_messages: list[str]
+    ) -> Optional[RedisSession]:
+        """Decode a session hash and its message list; None if the hash expired."""
+        if not meta:
+            return None
+
+        messages = []
+        for raw in raw_messages:
+            data = json.loads(raw)
+            messages.append(Message(
+                role=data["role"],
+                content=data["content"],
+                timestamp=data["timestamp"],
+                citations=[Citation(**c) for c in data.get("citations", [])],
+            ))
+
+        return RedisSession(
+            session_id=session_id,
+            created_at=float(meta["created_at"]),
+            last_activity=float(meta["last_activity"]),
+            messages=messages,
+            store=self,
+        )
+
+    def get_or_create_session(self, session_id: Optional[str]) -> RedisSession:
+        """Get existing session or create new one."""
+        if session_id:
+            session = self.get_session(session_id)
+            if session:
+                return session
+
+        return self.create_session()
+
+    def _append_message(self, session: Session, message: Message):
+        """Persist a message and refresh the session TTL."""
+        key = self._key(session.session_id)
+        msgs_key = self._msgs_key(session.session_id)
+        payload = json.dumps({
+            "role": message.role,
+            "content": message.content,
+            "timestamp": message.timestamp,
+            "citations": [c.model_dump() for c in message.citations],
+        }, ensure_ascii=False)
+
+        pipe = self._redis.pipeline()
+        pipe.rpush(msgs_key, payload)
+        # Write created_at too: if the hash expired since it was read, a bare
+        # last_activity write would recreate it without one
+        pipe.hset(key, mapping={
+            "created_at": session.created_at,
+            "last_activity": session.last_activity,
+        })
+        pipe.expire(key, self._ttl_seconds)
+        pipe.expire(msgs_key, self._ttl_seconds)
+        pipe.zadd(self.ACTIVE_KEY, {session.session_id: session.last_activity + self._ttl_seconds})
+        pipe.execute()
+
+    def get_all_sessions(self) -> list[SessionSummary]:
+        """
+        Get all active sessions as summaries.
+
+        Only each session's hash and message count are fetched; use
+        get_session() to load a session's messages.
+        """
+        pipe = self._redis.pipeline()
+        pipe.zremrangebyscore(self.ACTIVE_KEY, "-inf", time.time())
+        pipe.zrange(self.ACTIVE_KEY, 0, -1)
+        _, session_ids = pipe.execute()
+        if not session_ids:
+            return []
+
+        # Fetch every session's hash and message count in one round trip
+        pipe = self._redis.pipeline()
+        for session_id in session_ids:
+            pipe.hgetall(self._key(session_id))
+            pipe.llen(self._msgs_key(session_id))
+        replies = pipe.execute()
+
+        sessions = []
+        for i, session_id in enumerate(session_ids):
+            meta, message_count = replies[2 * i], replies[2 * i + 1]
+            if meta:
+                sessions.append(SessionSummary(
+                    session_id=session_id,
+                    created_at=float(meta["created_at"]),
+                    last_activity=float(meta["last_activity"]),
+                    message_count=message_count,
+                ))
+        return sessions
+
+    @property
+    def session_count(self) -> int:
+        """Number of active sessions."""
+        pipe = self._redis.pipeline()
+        pipe.zremrangebyscore(self.ACTIVE_KEY, "-inf", time.time())
+        pipe.zcard(self.ACTIVE_KEY)
+        return pipe.execute()[1]
+
+
+def create_session_store() -> Union[SessionStore, RedisSessionStore]:
+    """Create the session store selected by the SESSION_BACKEND env var."""
+    backend = os.getenv("SESSION_BACKEND", "memory").lower()
+    if backend == "redis":
+        return RedisSessionStore()
+    return SessionStore()
+
+
 # Global session store instance
-session_store = SessionStore()
+session_store = create_session_store()
 
@@ -6,6 +6,7 @@ Provides baseline evaluation using RAGAS metrics.
 from .metrics import EvaluationMetrics
 from .baseline_runner import BaselineRunner
 from .report_generator import ReportGenerator
+from .score_cache import ScoreCache
 
-__all__ = ["EvaluationMetrics", "BaselineRunner", "ReportGenerator"]
+__all__ = ["EvaluationMetrics", "BaselineRunner", "ReportGenerator", "ScoreCache"]
 
@@ -3,17 +3,23 @@ Baseline runner for evaluating GPT-4o and GPT-5.2 on the dev set.
 Runs models without RAG to establish baseline performance.
 """
 
-import json
 import time
 import asyncio
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
 from openai import OpenAI, AsyncOpenAI
 from tqdm import tqdm
 
-from .metrics import EvaluationMetrics, EvaluationResult, AggregatedMetrics
+from .metrics import (
+    EvaluationMetrics,
+    EvaluationResult,
+    AggregatedMetrics,
+    AnswerClass,
+    NO_CONTEXT_FAITHFULNESS,
+)
 
 
 @dataclass
@@ -27,6 +33,13 @@ class PromptStrategy:
         """Format the user prompt with the question and domain."""
         return self.user_template.format(question=question, domain=domain)
 
+    def build_messages(self, question: str, domain: str) -> list[dict]:
+        """Build the chat messages for a question."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self.format_user_prompt(question, domain)},
+        ]
+
 
 # Define prompt strategies to test
 PROMPT_STRATEGIES = {
@@ -78,6 +91,7 @@ class BaselineRunner:
         api_key: str | None = None,
         models: list[str] | None = None,
         strategies: list[str] | None = None,
+        score_cache_path: str | Path | None = None,
     ):
         """
         Initialize the baseline runner.
@@ -86,17 +100,18 @@ class BaselineRunner:
             api_key: OpenAI API key (uses env var if not provided)
             models: List of models to test (default: gpt-4o, gpt-4-turbo)
             strategies: List of prompt strategies to test
+            score_cache_path: SQLite file to persist RAGAS scores across runs (optional)
         """
         self.client = OpenAI(api_key=api_key)
         self.async_client = AsyncOpenAI(api_key=api_key)
         self.models = models or ["gpt-4o", "gpt-4-turbo"]
         self.strategies = strategies or list(PROMPT_STRATEGIES.keys())
-        self.metrics = EvaluationMetrics()
+        self.metrics = EvaluationMetrics(cache_path=score_cache_path)
     
     def load_dataset(self, dataset_path: str | Path) -> dict[str, list[dict]]:
         """Load the evaluation dataset from JSON."""
-        with open(dataset_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(dataset_path, "rb") as f:
+            return orjson.loads(f.read())
     
     def _flatten_dataset(self, dataset: dict[str, list[dict]]) -> list[dict]:
         """Flatten the domain-grouped dataset into a list of questions."""
@@ -115,9 +130,7 @@ class BaselineRunner:
     def _call_model(
         self,
         model: str,
-        strategy: PromptStrategy,
-        question: str,
-        domain: str,
+        messages: list[dict],
     ) -> tuple[str, float]:
         """
         Call the model and return the response with latency.
@@ -130,10 +143,7 @@ class BaselineRunner:
         try:
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": strategy.system_prompt},
-                    {"role": "user", "content": strategy.format_user_prompt(question, domain)},
-                ],
+                messages=messages,
                 temperature=0.0,  # Deterministic for evaluation
                 max_tokens=500,
             )
@@ -149,16 +159,50 @@ class BaselineRunner:
         strategy: PromptStrategy,
         question_data: dict,
         use_ragas: bool = True,
+        messages: list[dict] | None = None,
     ) -> EvaluationResult:
         """
         Evaluate a single question with a specific model and strategy.
+
+        Args:
+            messages: Pre-built prompt messages; built from the strategy if omitted
+        """
+        result, answer_class = self._generate_result(model, strategy, question_data, messages)
+
+        if use_ragas:
+            self._score_results([result])
+
+        self._finalize_result(result, answer_class)
+        return result
+
+    def _generate_result(
+        self,
+        model: str,
+        strategy: PromptStrategy,
+        question_data: dict,
+        messages: list[dict] | None = None,
+        response: tuple[str, float] | None = None,
+    ) -> tuple[EvaluationResult, AnswerClass]:
+        """
+        Get the model answer and compute the non-LLM metrics.
+
+        Args:
+            response: (answer, latency_ms) saved by an earlier run; the model
+                is only called when this is omitted
+
+        Returns:
+            The result and its yes/no classification, reused by _finalize_result
         """
         question = question_data["question"]
         expected = question_data["expected_answer"]
         domain = question_data["domain"]
 
-        # Get model response
-        generated, latency_ms = self._call_model(model, strategy, question, domain)
+        if response is None:
+            if messages is None:
+                messages = strategy.build_messages(question, domain)
+            response = self._call_model(model, messages)
+
+        generated, latency_ms = response
 
         # Create result object
         result = EvaluationResult(
@@ -174,37 +218,57 @@ class BaselineRunner:
         )
 
         # Calculate custom metrics
-        result.is_correct = self.metrics.check_correctness(expected, generated)
+        answer_class = self.metrics.classify_answer(expected, generated)
+        result.is_correct = self.metrics.check_correctness(expected, generated, answer_class)
         result.has_citation, result.citation_accurate = self.metrics.check_citation(generated)
 
-        # RAGAS evaluation (optional, can be slow)
-        if use_ragas:
-            try:
-                ragas_scores = self.metrics.evaluate_single(
-                    question=question,
-                    expected_answer=expected,
-                    generated_answer=generated,
-                    context=[],  # No context for baseline
-                )
-                result.answer_relevancy = ragas_scores.get("answer_relevancy", 0.0)
-                result.answer_correctness = ragas_scores.get("answer_correctness", 0.0)
-                result.faithfulness = ragas_scores.get("faithfulness", 0.0)
-            except Exception as e:
-                print(f"RAGAS error for question: {e}")
-
-        # Detect hallucination
+        return result, answer_class
+
+    def _score_results(self, results: list[EvaluationResult]) -> None:
+        """
+        Fill RAGAS scores for a batch of results.
+
+        Failed API calls produced no answer, so they are not sent to RAGAS.
+        Correct exact matches have known correctness, so only their relevancy
+        is scored. The remaining results are scored in a single batch.
+        Faithfulness for both shortcuts uses the same no-context value RAGAS
+        scoring reports, so neither is counted as a hallucination.
+        """
+        pending = []
+        exact_matches = []
+        for result in results:
+            if result.generated_answer.startswith("Error:"):
+                result.answer_relevancy = 0.0
+                result.answer_correctness = 0.0
+                result.faithfulness = NO_CONTEXT_FAITHFULNESS
+            elif result.is_correct and self.metrics.is_exact_match(
+                result.expected_answer, result.generated_answer
+            ):
+                result.answer_correctness = 1.0
+                result.faithfulness = NO_CONTEXT_FAITHFULNESS
+                exact_matches.append(result)
+            else:
+                pending.append(result)
+
+        try:
+            self.metrics.evaluate_relevancy_batch(exact_matches)
+            self.metrics.evaluate_batch(pending)  # No context for baseline
+        except Exception as e:
+            print(f"RAGAS error for batch: {e}")
+
+    def _finalize_result(self, result: EvaluationResult, answer_class: AnswerClass) -> None:
+        """Compute metrics that depend on the RAGAS scores."""
         result.is_hallucination = self.metrics.detect_hallucination(
-            generated, expected, result.faithfulness
+            result.generated_answer, result.expected_answer, result.faithfulness, answer_class
         )
 
-        return result
-
     def run_evaluation(
         self,
         dataset_path: str | Path,
         output_dir: str | Path = "data/evaluation/results",
         use_ragas: bool = True,
         verbose: bool = True,
+        resume: bool = False,
     ) -> dict[str, dict[str, AggregatedMetrics]]:
         """
         Run full baseline evaluation across all models and strategies.
@@ -214,6 +278,8 @@ class BaselineRunner:
             output_dir: Directory to save results
             use_ragas: Whether to use RAGAS metrics (slower but more accurate)
             verbose: Print progress
+            resume: Reuse answers saved in generations.jsonl by an earlier
+                (e.g. crashed) run instead of calling the model again
 
         Returns:
             Nested dict: {model: {strategy: AggregatedMetrics}}
@@ -231,45 +297,76 @@ class BaselineRunner:
             print(f"Strategies: {self.strategies}")
             print("-" * 50)
 
+        # Prompts depend only on (strategy, question), so build them once for all models
+        prompt_messages = {
+            strategy_name: [
+                PROMPT_STRATEGIES[strategy_name].build_messages(q["question"], q["domain"])
+                for q in questions
+            ]
+            for strategy_name in self.strategies
+        }
+
         all_results: dict[str, dict[str, AggregatedMetrics]] = {}
-        all_detailed_results: list[dict] = []
-
-        for model in self.models:
-            all_results[model] = {}
-
-            for strategy_name in self.strategies:
-                strategy = PROMPT_STRATEGIES[strategy_name]
-                results: list[EvaluationResult] = []
-
-                if verbose:
-                    print(f"\nEvaluating: {model} with {strategy_name} strategy")
-
-                # Evaluate each question
-                iterator = tqdm(questions, desc=f"{model}/{strategy_name}") if verbose else questions
-                for q in iterator:
-                    result = self.evaluate_single_question(
-                        model=model,
-                        strategy=strategy,
-                        question_data=q,
-                        use_ragas=use_ragas,
-                    )
-                    results.append(result)
-                    all_detailed_results.append(result.to_dict())
-
-                # Aggregate results
-                aggregated = self.metrics.aggregate_results(results)
-                all_results[model][strategy_name] = aggregated
-
-                if verbose:
-                    print(f"  Accuracy: {aggregated.accuracy:.2%}")
-                    print(f"  Hallucination Rate: {aggregated.hallucination_rate:.2%}")
-                    print(f"  Citation Rate: {aggregated.citation_rate:.2%}")
-                    print(f"  Avg Latency: {aggregated.avg_latency_ms:.0f}ms")
-
-        # Save detailed results
-        detailed_path = output_dir / "detailed_results.json"
-        with open(detailed_path, "w", encoding="utf-8") as f:
-            json.dump(all_detailed_results, f, ensure_ascii=False, indent=2)
+
+        # Each answer is appended to generations.jsonl as soon as the model
+        # returns, before the config is batch-scored, so a crash loses at most
+        # the call in flight. Scored rows go to detailed_results.jsonl per config.
+        generations_path = output_dir / "generations.jsonl"
+        saved = self._load_generations(generations_path) if resume else {}
+        detailed_jsonl_path = output_dir / "detailed_results.jsonl"
+        with open(generations_path, "wb") as generations_fp, open(detailed_jsonl_path, "wb") as detailed_fp:
+            # Carry the reusable answers over to the rewritten file
+            for row in saved.values():
+                generations_fp.write(orjson.dumps(row) + b"\n")
+            generations_fp.flush()
+
+            for model in self.models:
+                all_results[model] = {}
+
+                for strategy_name in self.strategies:
+                    strategy = PROMPT_STRATEGIES[strategy_name]
+                    results: list[EvaluationResult] = []
+                    answer_classes: list[AnswerClass] = []
+
+                    if verbose:
+                        print(f"\nEvaluating: {model} with {strategy_name} strategy")
+
+                    # Evaluate each question
+                    pairs = zip(questions, prompt_messages[strategy_name])
+                    iterator = tqdm(pairs, total=len(questions), desc=f"{model}/{strategy_name}") if verbose else pairs
+                    for q, messages in iterator:
+                        row = saved.get((model, strategy_name, q["question"]))
+                        if row is not None:
+                            response = (row["generated_answer"], row["latency_ms"])
+                            result, answer_class = self._generate_result(model, strategy, q, response=response)
+                        else:
+                            result, answer_class = self._generate_result(model, strategy, q, messages)
+                            generations_fp.write(orjson.dumps(result) + b"\n")
+                            generations_fp.flush()
+                        results.append(result)
+                        answer_classes.append(answer_class)
+
+                    # Score the whole config in one RAGAS batch
+                    if use_ragas:
+                        self._score_results(results)
+
+                    for result, answer_class in zip(results, answer_classes):
+                        self._finalize_result(result, answer_class)
+                        detailed_fp.write(orjson.dumps(result) + b"\n")
+                    detailed_fp.flush()
+
+                    # Aggregate results
+                    aggregated = self.metrics.aggregate_results(results)
+                    all_results[model][strategy_name] = aggregated
+
+                    if verbose:
+                        print(f"  Accuracy: {aggregated.accuracy:.2%}")
+                        print(f"  Hallucination Rate: {aggregated.hallucination_rate:.2%}")
+                        print(f"  Citation Rate: {aggregated.citation_rate:.2%}")
+                        print(f"  Avg Latency: {aggregated.avg_latency_ms:.0f}ms")
+
+        # Derive detailed_results.json (consumed by ReportGenerator) from the JSONL
+        self._jsonl_to_json_array(detailed_jsonl_path, output_dir / "detailed_results.json")
 
         # Save aggregated results
         aggregated_path = output_dir / "aggregated_results.json"
@@ -280,11 +377,48 @@ class BaselineRunner:
             }
             for model, strategies in all_results.items()
         }
-        with open(aggregated_path, "w", encoding="utf-8") as f:
-            json.dump(aggregated_data, f, ensure_ascii=False, indent=2)
+        with open(aggregated_path, "wb") as f:
+            f.write(orjson.dumps(aggregated_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         if verbose:
             print(f"\nResults saved to {output_dir}")
 
         return all_results
 
+    @staticmethod
+    def _load_generations(path: Path) -> dict[tuple[str, str, str], dict]:
+        """
+        Read answers saved by an earlier run, keyed by (model, strategy, question).
+
+        Failed calls are left out so they are retried, and a line truncated
+        by a crash is skipped.
+        """
+        if not path.exists():
+            return {}
+
+        saved = {}
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    row = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if row["generated_answer"].startswith("Error:"):
+                    continue
+                saved[(row["model"], row["prompt_strategy"], row["question"])] = row
+        return saved
+
+    @staticmethod
+    def _jsonl_to_json_array(jsonl_path: Path, json_path: Path) -> None:
+        """Write a JSON array from a JSONL file, one row at a time."""
+        with open(jsonl_path, "rb") as src, open(json_path, "wb") as dst:
+            dst.write(b"[")
+            first = True
+            for line in src:
+                line = line.rstrip(b"\n")
+                if not line:
+                    continue
+                dst.write(b"\n  " if first else b",\n  ")
+                dst.write(line)
+                first = False
+            dst.write(b"\n]\n" if not first else b"]\n")
@@ -6,21 +6,176 @@ Compatible with RAGAS 0.4.x API.
 """
 
 import json
+import re
 import asyncio
-from dataclasses import dataclass, field
+import importlib.util
+from collections import defaultdict
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
 from typing import Any
 
-# RAGAS 0.4.x imports
+from .score_cache import ScoreCache
+
 try:
-    from ragas.metrics import AnswerRelevancy, AnswerCorrectness, Faithfulness
-    from ragas.llms import llm_factory
-    RAGAS_AVAILABLE = True
+    import uvloop
 except ImportError:
-    RAGAS_AVAILABLE = False
-    print("Warning: RAGAS not available. Install with: pip install ragas")
+    uvloop = None
+
+# Max number of RAGAS scores kept in memory (in front of the optional SQLite cache)
+SCORE_CACHE_SIZE = 2048
+
+# Concurrent LLM calls used by batch RAGAS evaluation
+RAGAS_MAX_WORKERS = 32
+
+# Rows scored at once by evaluate_many (each row issues up to three LLM calls)
+RAGAS_CONCURRENCY = 16
+
+# Faithfulness reported for rows scored without retrieved context
+NO_CONTEXT_FAITHFULNESS = 0.5
+
+# Fields read by aggregate_results, fetched as one tuple per result
+_AGGREGATE_FIELDS = attrgetter(
+    "answer_relevancy",
+    "answer_correctness",
+    "faithfulness",
+    "latency_ms",
+    "is_correct",
+    "is_hallucination",
+    "has_citation",
+    "citation_accurate",
+    "domain",
+)
+
+# Citation markers, as one alternation: [source], Hebrew "source:", Hebrew
+# "page X", page X, source:, reference:, Hebrew "according to"
+_CITATION_RE = re.compile(r'\[.*?\]|מקור:|עמוד \d+|page \d+|source:|reference:|לפי', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+
+# Yes/no keyword flags; the _WIDE ones only count for check_correctness
+_YES = 1
+_NO = 2
+_YES_WIDE = 4
+_NO_WIDE = 8
+
+
+def _yes_no_pattern(
+    yes_words: list[str],
+    no_words: list[str],
+    narrow_yes: list[str],
+    narrow_no: list[str],
+) -> re.Pattern:
+    """
+    Build one regex that finds the yes/no keywords of both checks in a single scan.
+
+    The alternation sits inside a lookahead, so the scan tries every position
+    and a match never consumes the start of an overlapping keyword ("זכאי"
+    followed by "אינו" in "זכאינו"). Phrases containing a shorter keyword of
+    the same class ("לא מכוסה" contains "לא") are redundant for presence
+    checks and are dropped. Keywords missing from the narrower lists get their
+    own groups so each check can mask them.
+    """
+    def reduce(words: list[str]) -> list[str]:
+        return [w for w in words if not any(o != w and o in w for o in words)]
+
+    groups = {"yes": [], "yes_wide": [], "no": [], "no_wide": []}
+    for word in reduce(yes_words):
+        groups["yes" if word in narrow_yes else "yes_wide"].append(word)
+    for word in reduce(no_words):
+        groups["no" if word in narrow_no else "no_wide"].append(word)
+
+    # Only one alternative matches per position, so a keyword that starts
+    # another group's keyword would hide it
+    for name, words in groups.items():
+        for other, other_words in groups.items():
+            if other != name and any(o.startswith(w) for w in words for o in other_words):
+                raise ValueError(f"A {name} keyword is a prefix of a {other} keyword")
+
+    return re.compile("(?=" + "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, words))})"
+        for name, words in groups.items()
+        if words
+    ) + ")")
+
+
+# Hebrew + English yes/no keywords used by check_correctness; detect_hallucination
+# uses the narrower second pair of lists
+_YES_NO_RE = _yes_no_pattern(
+    ["כן", "yes", "נכון", "מכוסה", "זכאי"],
+    ["לא", "no", "אינו", "אינה", "לא מכוסה", "לא זכאי"],
+    ["כן", "yes", "נכון", "מכוסה"],
+    ["לא", "no", "אינו", "לא מכוסה"],
+)
+_YES_NO_FLAGS = {"yes": _YES, "yes_wide": _YES_WIDE, "no": _NO, "no_wide": _NO_WIDE}
+_ALL_FLAGS = _YES | _NO | _YES_WIDE | _NO_WIDE
+
+
+def _yes_no_flags(text: str) -> int:
+    """Return the yes/no keyword flags found in already-lowercased text."""
+    flags = 0
+    for match in _YES_NO_RE.finditer(text):
+        flags |= _YES_NO_FLAGS[match.lastgroup]
+        if flags == _ALL_FLAGS:
+            break
+    return flags
+
+
+@lru_cache(maxsize=4096)
+def _expected_yes_no_flags(expected: str) -> int:
+    """_yes_no_flags for ground-truth answers, which repeat for every model/strategy."""
+    return _yes_no_flags(expected.lower())
+
+
+def _is_yes_no(flags: int, yes_mask: int, no_mask: int) -> tuple[bool, bool]:
+    """Return (is_yes, is_no); an answer containing both kinds of keyword is a no."""
+    is_no = bool(flags & no_mask)
+    return bool(flags & yes_mask) and not is_no, is_no
+
+
+@lru_cache(maxsize=4096)
+def _expected_numbers(expected: str) -> frozenset[str]:
+    """Numbers in a ground-truth answer; cached for the same reason."""
+    return frozenset(_NUMBER_RE.findall(expected))
+
+
+@lru_cache(maxsize=4096)
+def _token_set(text: str) -> frozenset[str]:
+    """Lowercased whitespace tokens; cached since expected answers repeat across runs."""
+    return frozenset(text.lower().split())
+
+
+@lru_cache(maxsize=1)
+def _ragas_available() -> bool:
+    """Check whether RAGAS is installed without importing it."""
+    return importlib.util.find_spec("ragas") is not None
+
+
+async def _constant_score(value: float) -> float:
+    return value
+
 
+def _score_value(score: Any) -> float:
+    """Convert a RAGAS score (float or MetricResult; None / NaN on failure) to a float."""
+    if type(score) is not float:
+        # ascore() returns a MetricResult wrapping the float in .value
+        score = getattr(score, "value", score)
+        if score is None:
+            return 0.0
+    if score != score:
+        return 0.0
+    return float(score)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
+class AnswerClass:
+    """Yes/no keyword flags of an expected/generated answer pair, computed once per row."""
+    expected: int
+    generated: int
+
+
+@dataclass(slots=True)
 class EvaluationResult:
     """Single evaluation result for a question-answer pair."""
     question: str
@@ -47,28 +202,62 @@ class EvaluationResult:
     prompt_strategy: str = ""
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary (orjson can also serialize the dataclass directly)."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class DomainTable:
+    """Per-domain metrics stored column-wise, one list per metric."""
+    
+    domain: list[str] = field(default_factory=list)
+    total: list[int] = field(default_factory=list)
+    correct: list[int] = field(default_factory=list)
+    accuracy: list[float] = field(default_factory=list)
+    avg_relevancy: list[float] = field(default_factory=list)
+    hallucination_rate: list[float] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.domain)
+    
+    def append(
+        self,
+        domain: str,
+        total: int,
+        correct: int,
+        relevancy_sum: float,
+        hallucinations: int,
+    ) -> None:
+        """Add a domain row from its accumulated counts and sums."""
+        self.domain.append(domain)
+        self.total.append(total)
+        self.correct.append(correct)
+        self.accuracy.append(correct / total)
+        self.avg_relevancy.append(relevancy_sum / total)
+        self.hallucination_rate.append(hallucinations / total)
+    
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Build the nested {domain: {metric: value}} mapping."""
         return {
-            "question": self.question,
-            "expected_answer": self.expected_answer,
-            "generated_answer": self.generated_answer,
-            "domain": self.domain,
-            "source_file": self.source_file,
-            "source_page": self.source_page,
-            "answer_relevancy": self.answer_relevancy,
-            "answer_correctness": self.answer_correctness,
-            "faithfulness": self.faithfulness,
-            "is_correct": self.is_correct,
-            "has_citation": self.has_citation,
-            "citation_accurate": self.citation_accurate,
-            "is_hallucination": self.is_hallucination,
-            "latency_ms": self.latency_ms,
-            "model": self.model,
-            "prompt_strategy": self.prompt_strategy,
+            domain: {
+                "total": total,
+                "correct": correct,
+                "accuracy": accuracy,
+                "avg_relevancy": avg_relevancy,
+                "hallucination_rate": hallucination_rate,
+            }
+            for domain, total, correct, accuracy, avg_relevancy, hallucination_rate in zip(
+                self.domain,
+                self.total,
+                self.correct,
+                self.accuracy,
+                self.avg_relevancy,
+                self.hallucination_rate,
+            )
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedMetrics:
     """Aggregated metrics across all evaluation results."""
     total_questions: int = 0
@@ -89,25 +278,14 @@ class AggregatedMetrics:
     avg_latency_ms: float = 0.0
     
     # Per-domain breakdown
-    domain_metrics: dict[str, dict] = field(default_factory=dict)
+    domain_metrics: DomainTable = field(default_factory=DomainTable)
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "total_questions": self.total_questions,
-            "correct_answers": self.correct_answers,
-            "accuracy": self.accuracy,
-            "avg_answer_relevancy": self.avg_answer_relevancy,
-            "avg_answer_correctness": self.avg_answer_correctness,
-            "avg_faithfulness": self.avg_faithfulness,
-            "hallucination_count": self.hallucination_count,
-            "hallucination_rate": self.hallucination_rate,
-            "citation_count": self.citation_count,
-            "citation_rate": self.citation_rate,
-            "citation_accuracy": self.citation_accuracy,
-            "avg_latency_ms": self.avg_latency_ms,
-            "domain_metrics": self.domain_metrics,
-        }
+        """Convert to dictionary, with domain_metrics as {domain: {metric: value}}."""
+        # Skip asdict(): it would deep-copy every DomainTable column first
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "domain_metrics"}
+        data["domain_metrics"] = self.domain_metrics.to_dict()
+        return data
 
 
 class EvaluationMetrics:
@@ -116,31 +294,50 @@ class EvaluationMetrics:
     Provides answer relevancy, correctness, faithfulness, and custom metrics.
     """
 
-    def __init__(self, llm_model: str = "gpt-4o"):
+    def __init__(
+        self,
+        llm_model: str = "gpt-4o",
+        cache_path: str | Path | None = None,
+        cache_ttl_seconds: int | None = None,
+    ):
         """
         Initialize evaluation metrics.
 
         Args:
             llm_model: LLM model to use for RAGAS evaluation
+            cache_path: SQLite file for persisting RAGAS scores across runs (optional)
+            cache_ttl_seconds: Ignore persisted scores older than this
         """
         self.llm_model = llm_model
         self._llm = None
         self._metrics_initialized = False
+        self._score_cache: dict[str, dict[str, float]] = {}
+        self._disk_cache = ScoreCache(cache_path, cache_ttl_seconds) if cache_path else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     def _init_ragas_metrics(self):
-        """Initialize RAGAS metrics lazily."""
-        if not RAGAS_AVAILABLE:
+        """Initialize RAGAS metrics lazily (RAGAS is only imported here)."""
+        if self._metrics_initialized:
             return
 
-        if not self._metrics_initialized:
-            try:
-                self._llm = llm_factory(self.llm_model)
-                self._answer_relevancy = AnswerRelevancy(llm=self._llm)
-                self._answer_correctness = AnswerCorrectness(llm=self._llm)
-                self._faithfulness = Faithfulness(llm=self._llm)
-                self._metrics_initialized = True
-            except Exception as e:
-                print(f"Failed to initialize RAGAS metrics: {e}")
+        if not _ragas_available():
+            print("Warning: RAGAS not available. Install with: pip install ragas")
+            return
+
+        try:
+            # RAGAS 0.4.x imports
+            from ragas.metrics import AnswerRelevancy, AnswerCorrectness, Faithfulness
+            from ragas.llms import llm_factory
+
+            self._llm = llm_factory(self.llm_model)
+            self._answer_relevancy = AnswerRelevancy(llm=self._llm)
+            self._answer_correctness = AnswerCorrectness(llm=self._llm)
+            self._faithfulness = Faithfulness(llm=self._llm)
+            self._metrics_initialized = True
+        except Exception as e:
+            print(f"Failed to initialize RAGAS metrics: {e}")
 
     def evaluate_single(
         self,
@@ -161,94 +358,408 @@ class EvaluationMetrics:
         Returns:
             Dictionary of metric scores
         """
-        if not RAGAS_AVAILABLE:
-            return {
-                "answer_relevancy": 0.0,
-                "answer_correctness": 0.0,
-                "faithfulness": 0.0,
-            }
+        # temperature=0 generations repeat across strategies/models; score each pair once
+        key = self._cache_key(question, expected_answer, generated_answer, context)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return dict(cached)
+
+        scores = self._score_ragas(question, expected_answer, generated_answer, context)
+        if scores is not None:
+            self._cache_scores(key, scores)
+            return dict(scores)
+
+        return {
+            "answer_relevancy": 0.0,
+            "answer_correctness": 0.0,
+            "faithfulness": 0.0,
+        }
+
+    def evaluate_batch(
+        self,
+        results: list["EvaluationResult"],
+        contexts: list[list[str]] | None = None,
+    ) -> None:
+        """
+        Score many results with one RAGAS `evaluate()` call per metric set.
+
+        The whole batch is submitted as a single dataset so RAGAS can run the
+        LLM calls concurrently. Scores are written onto the results in place;
+        results already in the score cache are not re-submitted.
+
+        Args:
+            results: Results to score (question / expected / generated are read)
+            contexts: Retrieved context per result, aligned by index (optional)
+        """
+        if not results:
+            return
+        contexts = contexts or [[] for _ in results]
+
+        keys = [
+            self._cache_key(r.question, r.expected_answer, r.generated_answer, context)
+            for r, context in zip(results, contexts)
+        ]
+
+        pending: list[int] = []
+        for i, result in enumerate(results):
+            cached = self._get_cached(keys[i])
+            if cached is not None:
+                self._apply_scores(result, cached)
+            else:
+                pending.append(i)
+
+        if not pending or not _ragas_available():
+            return
 
         self._init_ragas_metrics()
+        if not self._metrics_initialized:
+            return
 
+        from ragas import evaluate as ragas_evaluate, EvaluationDataset
+        from ragas.run_config import RunConfig
+
+        # Faithfulness needs retrieved context, so rows without it run separately
+        with_context = [i for i in pending if contexts[i]]
+        without_context = [i for i in pending if not contexts[i]]
+
+        for indices, metrics in (
+            (with_context, [self._answer_relevancy, self._answer_correctness, self._faithfulness]),
+            (without_context, [self._answer_relevancy, self._answer_correctness]),
+        ):
+            if not indices:
+                continue
+
+            dataset = EvaluationDataset.from_list([
+                {
+                    "user_input": results[i].question,
+                    "response": results[i].generated_answer,
+                    "reference": results[i].expected_answer,
+                    "retrieved_contexts": contexts[i],
+                }
+                for i in indices
+            ])
+
+            try:
+                ragas_result = ragas_evaluate(
+                    dataset,
+                    metrics=metrics,
+                    llm=self._llm,
+                    run_config=RunConfig(max_workers=RAGAS_MAX_WORKERS),
+                    show_progress=False,
+                )
+            except Exception as e:
+                # One bad row fails the whole dataset; fall back to per-row scoring
+                print(f"RAGAS batch evaluation error: {e}")
+                self._run(self._ascore_many(
+                    [results[i] for i in indices],
+                    [contexts[i] for i in indices],
+                    [keys[i] for i in indices],
+                ))
+                continue
+
+            new_scores = []
+            for i, row in zip(indices, ragas_result.scores):
+                scores = {
+                    "answer_relevancy": _score_value(row.get(self._answer_relevancy.name)),
+                    "answer_correctness": _score_value(row.get(self._answer_correctness.name)),
+                    # Without context, faithfulness is not applicable
+                    "faithfulness": _score_value(row.get(self._faithfulness.name)) if contexts[i] else NO_CONTEXT_FAITHFULNESS,
+                }
+                new_scores.append((keys[i], scores))
+                self._apply_scores(results[i], scores)
+
+            self._cache_scores_many(new_scores)
+
+    def evaluate_relevancy_batch(self, results: list["EvaluationResult"]) -> None:
+        """
+        Score only answer relevancy for a batch of results, without context.
+
+        For rows whose correctness is already known (e.g. exact matches), so
+        RAGAS is asked for one metric instead of all of them. Relevancy is
+        written onto the results in place; other scores are left untouched.
+        """
+        if not results:
+            return
+
+        # Separate key namespace: these entries hold relevancy only
+        keys = [
+            ScoreCache.make_key(
+                f"{self.llm_model}:answer_relevancy", r.question, r.expected_answer, r.generated_answer
+            )
+            for r in results
+        ]
+
+        pending: list[int] = []
+        for i, result in enumerate(results):
+            cached = self._get_cached(keys[i])
+            if cached is not None:
+                result.answer_relevancy = cached["answer_relevancy"]
+            else:
+                pending.append(i)
+
+        if not pending or not _ragas_available():
+            return
+
+        self._init_ragas_metrics()
         if not self._metrics_initialized:
-            return {
-                "answer_relevancy": 0.0,
-                "answer_correctness": 0.0,
-                "faithfulness": 0.0,
+            return
+
+        from ragas import evaluate as ragas_evaluate, EvaluationDataset
+        from ragas.run_config import RunConfig
+
+        dataset = EvaluationDataset.from_list([
+            {
+                "user_input": results[i].question,
+                "response": results[i].generated_answer,
+                "reference": results[i].expected_answer,
             }
+            for i in pending
+        ])
 
-        # Run RAGAS evaluation using new API
         try:
-            # Create async event loop if needed
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            ragas_result = ragas_evaluate(
+                dataset,
+                metrics=[self._answer_relevancy],
+                llm=self._llm,
+                run_config=RunConfig(max_workers=RAGAS_MAX_WORKERS),
+                show_progress=False,
+            )
+        except Exception as e:
+            print(f"RAGAS relevancy evaluation error: {e}")
+            return
 
-            # Evaluate each metric
-            relevancy_score = loop.run_until_complete(
-                self._answer_relevancy.ascore(
+        new_scores = []
+        for i, row in zip(pending, ragas_result.scores):
+            scores = {"answer_relevancy": _score_value(row.get(self._answer_relevancy.name))}
+            new_scores.append((keys[i], scores))
+            results[i].answer_relevancy = scores["answer_relevancy"]
+
+        self._cache_scores_many(new_scores)
+
+    async def evaluate_many(
+        self,
+        results: list["EvaluationResult"],
+        contexts: list[list[str]] | None = None,
+        concurrency: int = RAGAS_CONCURRENCY,
+    ) -> list[dict[str, float]]:
+        """
+        Score results concurrently, one set of RAGAS calls per row.
+
+        Use this when rows can't be submitted as a single `evaluate()` dataset.
+        At most `concurrency` rows are in flight at once. Scores are written
+        onto the results in place and returned in the same order.
+
+        Args:
+            results: Results to score (question / expected / generated are read)
+            contexts: Retrieved context per result, aligned by index (optional)
+            concurrency: Maximum number of rows scored at the same time
+
+        Returns:
+            List of metric score dictionaries, aligned with results
+        """
+        contexts = contexts or [[] for _ in results]
+        keys = [
+            self._cache_key(r.question, r.expected_answer, r.generated_answer, context)
+            for r, context in zip(results, contexts)
+        ]
+
+        pending: list[int] = []
+        for i, result in enumerate(results):
+            cached = self._get_cached(keys[i])
+            if cached is not None:
+                self._apply_scores(result, cached)
+            else:
+                pending.append(i)
+
+        await self._ascore_many(
+            [results[i] for i in pending],
+            [contexts[i] for i in pending],
+            [keys[i] for i in pending],
+            concurrency,
+        )
+
+        return [
+            {
+                "answer_relevancy": r.answer_relevancy,
+                "answer_correctness": r.answer_correctness,
+                "faithfulness": r.faithfulness,
+            }
+            for r in results
+        ]
+
+    async def _ascore_many(
+        self,
+        results: list["EvaluationResult"],
+        contexts: list[list[str]],
+        keys: list[str],
+        concurrency: int = RAGAS_CONCURRENCY,
+    ) -> None:
+        """Score uncached rows concurrently, bounded by a semaphore."""
+        if not results:
+            return
+
+        self._init_ragas_metrics()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run(result: "EvaluationResult", context: list[str]) -> dict[str, float] | None:
+            async with sem:
+                return await self._ascore_one(
+                    result.question, result.expected_answer, result.generated_answer, context
+                )
+
+        all_scores = await asyncio.gather(*(run(r, c) for r, c in zip(results, contexts)))
+
+        new_scores = []
+        for key, result, scores in zip(keys, results, all_scores):
+            if scores is None:
+                scores = {"answer_relevancy": 0.0, "answer_correctness": 0.0, "faithfulness": 0.0}
+            else:
+                new_scores.append((key, scores))
+            self._apply_scores(result, scores)
+
+        self._cache_scores_many(new_scores)
+
+    def _cache_key(
+        self,
+        question: str,
+        expected_answer: str,
+        generated_answer: str,
+        context: list[str] | None,
+    ) -> str:
+        return ScoreCache.make_key(self.llm_model, question, expected_answer, generated_answer, context or ())
+
+    def _get_cached(self, key: str) -> dict[str, float] | None:
+        """Look up scores in memory, then in the persistent cache."""
+        scores = self._score_cache.get(key)
+        if scores is None and self._disk_cache is not None:
+            scores = self._disk_cache.get(key)
+            if scores is not None:
+                self._remember(key, scores)
+
+        if scores is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return scores
+
+    def _remember(self, key: str, scores: dict[str, float]) -> None:
+        if len(self._score_cache) >= SCORE_CACHE_SIZE:
+            self._score_cache.pop(next(iter(self._score_cache)))
+        self._score_cache[key] = scores
+
+    def _cache_scores(self, key: str, scores: dict[str, float]) -> None:
+        self._cache_scores_many([(key, scores)])
+
+    def _cache_scores_many(self, items: list[tuple[str, dict[str, float]]]) -> None:
+        for key, scores in items:
+            self._remember(key, scores)
+        if self._disk_cache is not None:
+            self._disk_cache.set_many(items)
+
+    @staticmethod
+    def _apply_scores(result: "EvaluationResult", scores: dict[str, float]) -> None:
+        result.answer_relevancy = scores["answer_relevancy"]
+        result.answer_correctness = scores["answer_correctness"]
+        result.faithfulness = scores["faithfulness"]
+
+    def _score_ragas(
+        self,
+        question: str,
+        expected_answer: str,
+        generated_answer: str,
+        context: list[str] | None,
+    ) -> dict[str, float] | None:
+        """Run the RAGAS metrics; returns None if RAGAS is unavailable or fails."""
+        if not _ragas_available():
+            return None
+
+        self._init_ragas_metrics()
+        return self._run(self._ascore_one(question, expected_answer, generated_answer, context))
+
+    async def _ascore_one(
+        self,
+        question: str,
+        expected_answer: str,
+        generated_answer: str,
+        context: list[str] | None,
+    ) -> dict[str, float] | None:
+        """Score one pair with the three RAGAS metrics running concurrently."""
+        if not self._metrics_initialized:
+            return None
+
+        # Run RAGAS evaluation using new API
+        try:
+            if context:
+                faithfulness_coro = self._faithfulness.ascore(
                     user_input=question,
                     response=generated_answer,
+                    retrieved_contexts=context,
                 )
-            )
+            else:
+                # Without context, faithfulness is not applicable
+                faithfulness_coro = _constant_score(NO_CONTEXT_FAITHFULNESS)
 
-            correctness_score = loop.run_until_complete(
+            relevancy_score, correctness_score, faithfulness_score = await asyncio.gather(
+                self._answer_relevancy.ascore(
+                    user_input=question,
+                    response=generated_answer,
+                ),
                 self._answer_correctness.ascore(
                     user_input=question,
                     response=generated_answer,
                     reference=expected_answer,
-                )
+                ),
+                faithfulness_coro,
             )
 
-            # Faithfulness requires context
-            if context:
-                faithfulness_score = loop.run_until_complete(
-                    self._faithfulness.ascore(
-                        user_input=question,
-                        response=generated_answer,
-                        retrieved_contexts=context,
-                    )
-                )
-            else:
-                # Without context, faithfulness is not applicable
-                faithfulness_score = type('obj', (object,), {'value': 0.5})()
-
             return {
-                "answer_relevancy": getattr(relevancy_score, 'value', relevancy_score) if relevancy_score else 0.0,
-                "answer_correctness": getattr(correctness_score, 'value', correctness_score) if correctness_score else 0.0,
-                "faithfulness": getattr(faithfulness_score, 'value', faithfulness_score) if faithfulness_score else 0.0,
+                "answer_relevancy": _score_value(relevancy_score),
+                "answer_correctness": _score_value(correctness_score),
+                "faithfulness": _score_value(faithfulness_score),
             }
         except Exception as e:
             print(f"RAGAS evaluation error: {e}")
-            return {
-                "answer_relevancy": 0.0,
-                "answer_correctness": 0.0,
-                "faithfulness": 0.0,
-            }
+            return None
+
+    def _run(self, coro):
+        """Run a coroutine on this instance's persistent event loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def is_exact_match(self, expected: str, generated: str) -> bool:
+        """Check if the answers are equal up to case and whitespace."""
+        return expected.lower().split() == generated.lower().split()
+
+    def classify_answer(self, expected: str, generated: str) -> AnswerClass:
+        """
+        Scan both answers for yes/no keywords once.
+
+        Pass the result to check_correctness and detect_hallucination so the
+        row is not scanned again by each check.
+        """
+        return AnswerClass(
+            expected=_expected_yes_no_flags(expected),
+            generated=_yes_no_flags(generated.lower()),
+        )
 
     def check_correctness(
         self,
         expected: str,
         generated: str,
+        answer_class: AnswerClass | None = None,
     ) -> bool:
         """
         Check if the generated answer is correct.
         Uses simple heuristics for yes/no questions and keyword matching.
         """
-        expected_lower = expected.lower().strip()
-        generated_lower = generated.lower().strip()
+        if answer_class is None:
+            answer_class = self.classify_answer(expected, generated)
 
         # Handle yes/no questions (Hebrew)
-        yes_words = ["כן", "yes", "נכון", "מכוסה", "זכאי"]
-        no_words = ["לא", "no", "אינו", "אינה", "לא מכוסה", "לא זכאי"]
-
-        expected_is_yes = any(w in expected_lower for w in yes_words) and not any(w in expected_lower for w in no_words)
-        expected_is_no = any(w in expected_lower for w in no_words)
-
-        generated_is_yes = any(w in generated_lower for w in yes_words) and not any(w in generated_lower for w in no_words)
-        generated_is_no = any(w in generated_lower for w in no_words)
+        yes_mask, no_mask = _YES | _YES_WIDE, _NO | _NO_WIDE
+        expected_is_yes, expected_is_no = _is_yes_no(answer_class.expected, yes_mask, no_mask)
+        generated_is_yes, generated_is_no = _is_yes_no(answer_class.generated, yes_mask, no_mask)
 
         if expected_is_yes and generated_is_yes:
             return True
@@ -257,17 +768,14 @@ class EvaluationMetrics:
 
         # For non-yes/no, check if key parts of expected are in generated
         # Extract numbers and key terms
-        import re
-        expected_numbers = set(re.findall(r'\d+(?:\.\d+)?', expected))
-        generated_numbers = set(re.findall(r'\d+(?:\.\d+)?', generated))
+        expected_numbers = _expected_numbers(expected)
 
-        if expected_numbers and expected_numbers.issubset(generated_numbers):
+        if expected_numbers and expected_numbers.issubset(_NUMBER_RE.findall(generated)):
             return True
 
         # Check for significant overlap
-        expected_words = set(expected_lower.split())
-        generated_words = set(generated_lower.split())
-        overlap = len(expected_words & generated_words) / max(len(expected_words), 1)
+        expected_words = _token_set(expected)
+        overlap = len(expected_words & _token_set(generated)) / max(len(expected_words), 1)
 
         return overlap > 0.5
 
@@ -278,20 +786,7 @@ class EvaluationMetrics:
         Returns:
             Tuple of (has_citation, citation_accurate)
         """
-        import re
-
-        # Look for citation patterns
-        citation_patterns = [
-            r'\[.*?\]',  # [source]
-            r'מקור:',    # Hebrew: source:
-            r'עמוד \d+', # Hebrew: page X
-            r'page \d+',
-            r'source:',
-            r'reference:',
-            r'לפי',      # Hebrew: according to
-        ]
-
-        has_citation = any(re.search(p, generated, re.IGNORECASE) for p in citation_patterns)
+        has_citation = _CITATION_RE.search(generated) is not None
 
         # For baseline (no RAG), citation accuracy is always False
         # This will be updated when we have actual document retrieval
@@ -304,6 +799,7 @@ class EvaluationMetrics:
         generated: str,
         expected: str,
         faithfulness_score: float,
+        answer_class: AnswerClass | None = None,
     ) -> bool:
         """
         Detect if the answer is a hallucination.
@@ -318,16 +814,11 @@ class EvaluationMetrics:
             return True
 
         # Check for contradiction in yes/no
-        expected_lower = expected.lower()
-        generated_lower = generated.lower()
-
-        yes_words = ["כן", "yes", "נכון", "מכוסה"]
-        no_words = ["לא", "no", "אינו", "לא מכוסה"]
+        if answer_class is None:
+            answer_class = self.classify_answer(expected, generated)
 
-        expected_is_yes = any(w in expected_lower for w in yes_words) and not any(w in expected_lower for w in no_words)
-        expected_is_no = any(w in expected_lower for w in no_words)
-        generated_is_yes = any(w in generated_lower for w in yes_words) and not any(w in generated_lower for w in no_words)
-        generated_is_no = any(w in generated_lower for w in no_words)
+        expected_is_yes, expected_is_no = _is_yes_no(answer_class.expected, _YES, _NO)
+        generated_is_yes, generated_is_no = _is_yes_no(answer_class.generated, _YES, _NO)
 
         # Contradiction = hallucination
         if (expected_is_yes and generated_is_no) or (expected_is_no and generated_is_yes):
@@ -345,40 +836,58 @@ class EvaluationMetrics:
         if not results:
             return AggregatedMetrics()
 
+        n = len(results)
+
+        # Single pass over results: global sums and per-domain accumulators together
+        relevancy = correctness = faithfulness = latency = 0.0
+        correct = hallucinations = citations = accurate_citations = 0
+        domains: defaultdict[str, dict[str, Any]] = defaultdict(
+            lambda: {"total": 0, "correct": 0, "relevancy": 0.0, "hallucinations": 0}
+        )
+
+        for ar, ac, fa, lat, ic, ih, hc, ca, domain in map(_AGGREGATE_FIELDS, results):
+            relevancy += ar
+            correctness += ac
+            faithfulness += fa
+            latency += lat
+            correct += ic
+            hallucinations += ih
+            if hc:
+                citations += 1
+                accurate_citations += ca
+
+            d = domains[domain]
+            d["total"] += 1
+            d["correct"] += ic
+            d["relevancy"] += ar
+            d["hallucinations"] += ih
+
         metrics = AggregatedMetrics()
-        metrics.total_questions = len(results)
-
-        # Calculate averages
-        metrics.correct_answers = sum(1 for r in results if r.is_correct)
-        metrics.accuracy = metrics.correct_answers / metrics.total_questions
-
-        metrics.avg_answer_relevancy = sum(r.answer_relevancy for r in results) / len(results)
-        metrics.avg_answer_correctness = sum(r.answer_correctness for r in results) / len(results)
-        metrics.avg_faithfulness = sum(r.faithfulness for r in results) / len(results)
-
-        metrics.hallucination_count = sum(1 for r in results if r.is_hallucination)
-        metrics.hallucination_rate = metrics.hallucination_count / metrics.total_questions
-
-        metrics.citation_count = sum(1 for r in results if r.has_citation)
-        metrics.citation_rate = metrics.citation_count / metrics.total_questions
-
-        citations_with_accuracy = [r for r in results if r.has_citation]
-        if citations_with_accuracy:
-            metrics.citation_accuracy = sum(1 for r in citations_with_accuracy if r.citation_accurate) / len(citations_with_accuracy)
-
-        metrics.avg_latency_ms = sum(r.latency_ms for r in results) / len(results)
-
-        # Per-domain breakdown
-        domains = set(r.domain for r in results)
-        for domain in domains:
-            domain_results = [r for r in results if r.domain == domain]
-            metrics.domain_metrics[domain] = {
-                "total": len(domain_results),
-                "correct": sum(1 for r in domain_results if r.is_correct),
-                "accuracy": sum(1 for r in domain_results if r.is_correct) / len(domain_results),
-                "avg_relevancy": sum(r.answer_relevancy for r in domain_results) / len(domain_results),
-                "hallucination_rate": sum(1 for r in domain_results if r.is_hallucination) / len(domain_results),
-            }
+        metrics.total_questions = n
 
-        return metrics
+        metrics.correct_answers = correct
+        metrics.accuracy = correct / n
+
+        metrics.avg_answer_relevancy = relevancy / n
+        metrics.avg_answer_correctness = correctness / n
+        metrics.avg_faithfulness = faithfulness / n
+
+        metrics.hallucination_count = hallucinations
+        metrics.hallucination_rate = hallucinations / n
+
+        metrics.citation_count = citations
+        metrics.citation_rate = citations / n
 
+        if citations:
+            metrics.citation_accuracy = accurate_citations / citations
+
+        metrics.avg_latency_ms = latency / n
+
+        # Per-domain breakdown: derive ratios from the accumulated sums
+        for domain in sorted(domains):
+            d = domains[domain]
+            metrics.domain_metrics.append(
+                domain, d["total"], d["correct"], d["relevancy"], d["hallucinations"]
+            )
+
+        return metrics
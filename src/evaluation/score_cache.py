@@ -0,0 +1,110 @@
+"""
+Persistent cache for RAGAS scores.
+Re-runs, ablations and report regenerations re-score identical answers; this
+avoids paying the LLM judge again for a pair that was already scored.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class ScoreCache:
+    """
+    SQLite-backed cache of RAGAS scores.
+
+    Keys are SHA-256 digests of (judge model, question, expected, generated,
+    context), so a score is only reused for exactly the same inputs.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: int | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl_seconds: Ignore entries older than this (None = never expire)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scores (
+                key TEXT PRIMARY KEY,
+                relevancy REAL,
+                correctness REAL,
+                faithfulness REAL,
+                ts INTEGER
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        question: str,
+        expected: str,
+        generated: str,
+        context: list[str] | tuple[str, ...] = (),
+    ) -> str:
+        """Build the content-addressed key for a scored pair."""
+        h = hashlib.sha256()
+        for part in (model, question, expected, generated, str(len(context)), *context):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def get(self, key: str) -> dict[str, float] | None:
+        """Get cached scores, or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT relevancy, correctness, faithfulness, ts FROM scores WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        if self.ttl_seconds is not None and time.time() - row[3] > self.ttl_seconds:
+            return None
+
+        return {
+            "answer_relevancy": row[0],
+            "answer_correctness": row[1],
+            "faithfulness": row[2],
+        }
+
+    def set_many(self, items: list[tuple[str, dict[str, float]]]) -> None:
+        """Store scores for several keys in one transaction."""
+        if not items:
+            return
+        now = int(time.time())
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        key,
+                        scores["answer_relevancy"],
+                        scores["answer_correctness"],
+                        scores["faithfulness"],
+                        now,
+                    )
+                    for key, scores in items
+                ],
+            )
+            self._conn.commit()
+
+    def set(self, key: str, scores: dict[str, float]) -> None:
+        """Store scores for a key."""
+        self.set_many([(key, scores)])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
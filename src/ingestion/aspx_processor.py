@@ -4,12 +4,18 @@ ASPX Processor - Process scraped ASPX pages for ingestion.
 Converts scraped JSON files into ProcessedDocument format for indexing.
 """
 
-import json
 import logging
+import mmap
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 
+import orjson
+
 from .pdf_processor import ProcessedDocument, PageContent, StructuredItem
 
 logger = logging.getLogger(__name__)
@@ -31,6 +37,8 @@ DOMAIN_MAPPING = {
     "loss-of-working-ability": "life",  # Map to life
     "diseases-disabilities": "health",  # Map to health
 }
+# Interned keys/values: lookups with an interned domain hit the identity fast path
+DOMAIN_MAPPING = {sys.intern(k): sys.intern(v) for k, v in DOMAIN_MAPPING.items()}
 
 
 @dataclass
@@ -38,6 +46,33 @@ class ASPXProcessorConfig:
     """Configuration for ASPX processor."""
     input_dir: str = "data/raw/aspx"
     min_content_length: int = 100  # Minimum content length to process
+    max_workers: Optional[int] = None  # Processes for process_all (None = CPU count, 1 = serial)
+
+
+# Below this many pages process_all stays serial (pool startup would dominate)
+PARALLEL_MIN_PAGES = 64
+
+# Page files at least this large are memory-mapped instead of read into a copy
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _load_page_json(page_path: Path) -> dict:
+    """Decode a page JSON file; large files are parsed straight from an mmap."""
+    with open(page_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _page_files(domain_dir: Path) -> list[Path]:
+    """Sorted page_*.json files in a domain directory, listed with one scandir."""
+    with os.scandir(domain_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("page_") and entry.name.endswith(".json")
+        )
 
 
 class ASPXProcessor:
@@ -57,8 +92,7 @@ class ASPXProcessor:
     def process_page(self, page_path: Path, domain: str) -> Optional[ProcessedDocument]:
         """Process a single ASPX page JSON file."""
         try:
-            with open(page_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_page_json(page_path)
             
             content_text = data.get("content_text", "")
             
@@ -66,16 +100,20 @@ class ASPXProcessor:
             if len(content_text) < self.config.min_content_length:
                 return None
             
-            # Convert structured content to StructuredItem objects
+            # Convert structured content to StructuredItem objects, collecting headers in the same pass
             structured_items = []
-            for item in data.get("structured_content", []):
+            headers = []
+            for item in data.get("structured_content", ()):
+                item_type = item.get("type", "text")
                 structured_items.append(StructuredItem(
-                    item_type=item.get("type", "text"),
+                    item_type=item_type,
                     text=item.get("text", ""),
                     page_num=1,  # ASPX pages are single-page
                     level=item.get("level", 0),
                     section_path=[],  # Will be built during indexing
                 ))
+                if item_type == "header":
+                    headers.append(item["text"])
             
             # Create page content
             page_content = PageContent(
@@ -83,13 +121,12 @@ class ASPXProcessor:
                 text=content_text,
                 char_count=len(content_text),
                 has_tables=len(data.get("tables", [])) > 0,
-                headers=[item["text"] for item in data.get("structured_content", [])
-                        if item.get("type") == "header"],
+                headers=headers,
                 structured_items=structured_items,
             )
             
             # Map domain to standard domain
-            standard_domain = DOMAIN_MAPPING.get(domain, domain)
+            standard_domain = DOMAIN_MAPPING.get(sys.intern(domain), domain)
             
             return ProcessedDocument(
                 filename=page_path.name,
@@ -98,8 +135,7 @@ class ASPXProcessor:
                 pages=[page_content],
                 total_chars=len(content_text),
                 has_tables=page_content.has_tables,
-                detected_headers=[item["text"] for item in data.get("structured_content", [])
-                                 if item.get("type") == "header"],
+                detected_headers=headers.copy(),
                 processing_method="aspx",
                 structured_items=structured_items,
                 domain=standard_domain,
@@ -123,7 +159,7 @@ class ASPXProcessor:
             return []
         
         documents = []
-        for page_file in sorted(domain_dir.glob("page_*.json")):
+        for page_file in _page_files(domain_dir):
             doc = self.process_page(page_file, domain)
             if doc:
                 documents.append(doc)
@@ -132,14 +168,35 @@ class ASPXProcessor:
         return documents
 
     def process_all(self) -> list[ProcessedDocument]:
-        """Process all ASPX pages from all domains."""
-        all_documents = []
+        """
+        Process all ASPX pages from all domains.
         
-        for domain_dir in sorted(self.input_dir.iterdir()):
-            if domain_dir.is_dir():
-                domain = domain_dir.name
-                documents = self.process_domain(domain)
-                all_documents.extend(documents)
+        Pages are independent, so they are decoded in a process pool; results
+        keep the (domain, filename) order of a serial run.
+        """
+        tasks = [
+            (domain_dir.name, page_file)
+            for domain_dir in sorted(self.input_dir.iterdir())
+            if domain_dir.is_dir()
+            for page_file in _page_files(domain_dir)
+        ]
+        
+        workers = self.config.max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(tasks) < PARALLEL_MIN_PAGES:
+            results = [self.process_page(page_file, domain) for domain, page_file in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.config,),
+            ) as executor:
+                results = list(executor.map(_process_page_worker, tasks, chunksize=32))
+        
+        all_documents = [doc for doc in results if doc]
+        
+        per_domain = Counter(doc.metadata["original_domain"] for doc in all_documents)
+        for domain, count in per_domain.items():
+            logger.info(f"Processed {count} pages from domain: {domain}")
         
         logger.info(f"Total ASPX documents processed: {len(all_documents)}")
         return all_documents
@@ -149,7 +206,23 @@ class ASPXProcessor:
         stats = {}
         for domain_dir in sorted(self.input_dir.iterdir()):
             if domain_dir.is_dir():
-                count = len(list(domain_dir.glob("page_*.json")))
-                stats[domain_dir.name] = count
+                with os.scandir(domain_dir) as entries:
+                    stats[domain_dir.name] = sum(
+                        1 for entry in entries
+                        if entry.name.startswith("page_") and entry.name.endswith(".json")
+                    )
         return stats
 
+
+# Process pool workers build one processor each (see ASPXProcessor.process_all)
+_worker_processor: Optional[ASPXProcessor] = None
+
+
+def _init_worker(config: ASPXProcessorConfig) -> None:
+    global _worker_processor
+    _worker_processor = ASPXProcessor(config)
+
+
+def _process_page_worker(task: tuple[str, Path]) -> Optional[ProcessedDocument]:
+    domain, page_path = task
+    return _worker_processor.process_page(page_path, domain)
@@ -10,26 +10,86 @@ Combines:
 Outputs chunks ready for embedding and vector storage.
 """
 
+import hashlib
 import logging
-import uuid
+import os
+import pickle
+import re
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+import orjson
+from tqdm import tqdm
+
+from ..processing.chunker import AdaptiveChunker
 from .pdf_processor import PDFProcessor, ProcessedDocument
 from .topic_taxonomy import TopicTaxonomy
 from .document_registry import DocumentRegistry
 
-# Import chunker from processing module
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from processing.chunker import AdaptiveChunker
-
 logger = logging.getLogger(__name__)
 
+_LEADING_WS = re.compile(r"\s*")
+
+# Document-level topics kept in the registry / IndexingResult
+DOC_TOPICS_LIMIT = 10
+
+# Per-document strings repeated in every chunk; interned so they are shared
+_INTERNED_CHUNK_KEYS = ("source_file", "source_filename", "domain", "content_type")
+
+# Integer chunk fields returned as int32 arrays by get_chunk_columns()
+_NUMERIC_CHUNK_KEYS = frozenset({"page_num", "chunk_index", "char_count", "chunk_size_used"})
+
+# Content type by first non-whitespace character ("|" and "#" handled separately)
+_FIRST_CHAR_TYPE = {"•": "list", "-": "list"}
+
+# index_directory writes chunks.json every this many documents (bounds log replay)
+FINALIZE_EVERY_DOCS = 50
+
+# Files submitted ahead per worker in index_directory (bounds buffered results)
+PARALLEL_IN_FLIGHT_PER_WORKER = 2
+
+
+def _detect_content_type(raw_text: str) -> tuple[str, bool]:
+    """
+    Classify chunk text as table / list / header / text.
+
+    Returns:
+        Tuple of (content_type, has_table)
+    """
+    # First non-whitespace char, without copying via strip()
+    start = _LEADING_WS.match(raw_text).end()
+    first = raw_text[start:start + 1]
+
+    if first == "|" or "[טבלה]" in raw_text:
+        return "table", True
+    if first == "#":
+        # Headers start with "##"
+        return ("header" if raw_text.startswith("#", start + 1) else "text"), False
+    return _FIRST_CHAR_TYPE.get(first, "text"), False
+
+
+def _top_topics(topic_counts: Counter) -> list[str]:
+    """Most frequent topics across a document's chunks (ties: first seen first)."""
+    return [topic for topic, _ in topic_counts.most_common(DOC_TOPICS_LIMIT)]
 
-@dataclass
+
+def _intern_chunk_strings(chunk: dict) -> dict:
+    """Intern the repeated string fields of a chunk dict loaded from disk."""
+    for key in _INTERNED_CHUNK_KEYS:
+        value = chunk.get(key)
+        if value is not None:
+            chunk[key] = sys.intern(value)
+    return chunk
+
+
+@dataclass(slots=True)
 class IndexedChunk:
     """A chunk ready for embedding and vector storage."""
     id: str
@@ -62,6 +122,7 @@ class IndexedChunk:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        # A literal builds the dict in one step (faster than looping over fields)
         return {
             "id": self.id,
             "text": self.text,
@@ -83,7 +144,7 @@ class IndexedChunk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexingResult:
     """Result of indexing a document."""
     filepath: str
@@ -122,7 +183,8 @@ class DocumentIndexer:
 
         Args:
             registry_path: Path to document registry JSON
-            chunks_path: Path to chunks JSON store
+            chunks_path: Path to chunks JSON store (newly indexed chunks are
+                appended to a sibling .ndjson log until finalize())
             taxonomy_path: Path to saved taxonomy (optional)
             use_ocr: Enable OCR for scanned PDFs
         """
@@ -131,33 +193,81 @@ class DocumentIndexer:
         self.taxonomy = TopicTaxonomy()
         self.registry = DocumentRegistry(registry_path)
         self.chunks_path = Path(chunks_path)
+        self.chunks_log_path = self.chunks_path.with_suffix(".ndjson")
+        self.chunks_cache_path = self.chunks_path.with_suffix(".pkl")
 
         # Load saved taxonomy if provided
         if taxonomy_path and Path(taxonomy_path).exists():
             self.taxonomy = TopicTaxonomy.load(taxonomy_path)
 
-        # Load existing chunks
+        # Load existing chunks; dirty ids are chunks not yet in chunks.json
         self._chunks_store: dict[str, dict] = {}
+        self._dirty_ids: set[str] = set()
         self._load_chunks()
 
         logger.info(f"DocumentIndexer initialized: registry={registry_path}, chunks={chunks_path}")
 
     def _load_chunks(self):
-        """Load existing chunks from JSON file."""
-        if self.chunks_path.exists():
+        """Load existing chunks from the JSON file, then replay the NDJSON log."""
+        if self._load_chunks_cache():
+            logger.info(f"Loaded {len(self._chunks_store)} existing chunks from cache")
+        elif self.chunks_path.exists():
             try:
-                import json
-                with open(self.chunks_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for chunk in data.get("chunks", []):
-                        self._chunks_store[chunk["id"]] = chunk
+                data = orjson.loads(self.chunks_path.read_bytes())
+                for chunk in data.get("chunks", []):
+                    self._chunks_store[chunk["id"]] = _intern_chunk_strings(chunk)
                 logger.info(f"Loaded {len(self._chunks_store)} existing chunks")
             except Exception as e:
                 logger.warning(f"Failed to load chunks: {e}")
 
+        # Chunks indexed since the last finalize() (e.g. an interrupted run)
+        if self.chunks_log_path.exists():
+            replayed = 0
+            with open(self.chunks_log_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        chunk = orjson.loads(line)
+                    except ValueError as e:
+                        logger.warning(f"Skipping corrupt chunk log line: {e}")
+                        continue
+                    self._chunks_store[chunk["id"]] = _intern_chunk_strings(chunk)
+                    self._dirty_ids.add(chunk["id"])
+                    replayed += 1
+            logger.info(f"Replayed {replayed} chunks from {self.chunks_log_path}")
+
+    def _load_chunks_cache(self) -> bool:
+        """
+        Load the chunk store from the pickle written alongside chunks.json.
+
+        Only used when it is at least as new as chunks.json (i.e. the JSON
+        was not replaced by something else since); returns False otherwise.
+        """
+        try:
+            if self.chunks_cache_path.stat().st_mtime < self.chunks_path.stat().st_mtime:
+                return False
+            with open(self.chunks_cache_path, "rb") as f:
+                self._chunks_store = pickle.load(f)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable chunk cache {self.chunks_cache_path}: {e}")
+            self._chunks_store = {}
+            return False
+
+    def _append_chunks(self, chunks: list[IndexedChunk]):
+        """Append newly indexed chunks to the NDJSON log."""
+        self.chunks_log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.chunks_log_path, "ab") as f:
+            f.writelines(orjson.dumps(self._chunks_store[chunk.id]) + b"\n" for chunk in chunks)
+
+        logger.debug(f"Appended {len(chunks)} chunks to {self.chunks_log_path}")
+
     def _save_chunks(self):
-        """Save all chunks to JSON file."""
-        import json
+        """Save all chunks to the JSON file and clear the NDJSON log."""
         self.chunks_path.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
@@ -166,12 +276,46 @@ class DocumentIndexer:
             "chunks": list(self._chunks_store.values()),
         }
 
-        with open(self.chunks_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Write temp files and rename them into place, so a crash mid-write
+        # leaves the previous files (and the NDJSON log) intact.
+        # orjson emits UTF-8 directly (same output as ensure_ascii=False, indent=2)
+        tmp_path = self.chunks_path.with_name(self.chunks_path.name + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.chunks_path)
+
+        # Binary copy of the store for fast warm starts (see _load_chunks_cache)
+        tmp_path = self.chunks_cache_path.with_name(self.chunks_cache_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self._chunks_store, f, protocol=5)
+        os.replace(tmp_path, self.chunks_cache_path)
+
+        # Everything in the log is now in the consolidated file
+        self.chunks_log_path.unlink(missing_ok=True)
+        self._dirty_ids.clear()
 
         logger.info(f"Saved {len(self._chunks_store)} chunks to {self.chunks_path}")
 
-    def _build_section_map(self, doc: ProcessedDocument) -> dict[int, list[str]]:
+    def finalize(self):
+        """
+        Write the consolidated chunks JSON.
+
+        Indexing only appends to the NDJSON log; call this once after a batch
+        of documents so readers of chunks.json see the new chunks. Does
+        nothing if no chunks were added since the last write.
+        """
+        if not self._dirty_ids and self.chunks_path.exists():
+            logger.debug(f"{self.chunks_path} is up to date")
+            return
+        self._save_chunks()
+
+    @staticmethod
+    def _chunk_id_prefix(filepath: str) -> str:
+        """Per-document chunk id prefix: file stem plus a short hash of the full path."""
+        digest = hashlib.blake2b(filepath.encode("utf-8"), digest_size=4).hexdigest()
+        return f"{Path(filepath).stem}_{digest}"
+
+    @staticmethod
+    def _build_section_map(doc: ProcessedDocument) -> dict[int, list[str]]:
         """
         Build a map of page numbers to section paths.
 
@@ -185,115 +329,111 @@ class DocumentIndexer:
             Dict mapping page_num -> section_path (list of section headers)
         """
         section_map: dict[int, list[str]] = {}
+        # Header stack, truncated in place; only copied when a new page starts
         current_section_path: list[str] = []
+        last_page = None
 
         for item in doc.structured_items:
             if item.item_type == "header":
                 # Update section path based on header level
-                if item.level < len(current_section_path):
-                    current_section_path = current_section_path[:item.level]
+                del current_section_path[item.level:]
                 current_section_path.append(item.text)
 
-            # Store the current section path for this page
-            if item.page_num not in section_map:
-                section_map[item.page_num] = current_section_path.copy()
+            # Store the current section path for this page. Items come in page
+            # order, so only page transitions need a map lookup; the first
+            # occurrence still wins if a page ever shows up again later.
+            page_num = item.page_num
+            if page_num != last_page:
+                last_page = page_num
+                if page_num not in section_map:
+                    section_map[page_num] = current_section_path.copy()
 
         return section_map
 
-    def index_processed_document(self, doc: ProcessedDocument) -> IndexingResult:
+    @staticmethod
+    def _build_chunks(
+        doc: ProcessedDocument,
+        doc_metadata: dict,
+        chunker: AdaptiveChunker,
+        taxonomy: TopicTaxonomy,
+    ) -> tuple[list[IndexedChunk], list[str]]:
         """
-        Index a pre-processed document (PDF or ASPX).
+        Chunk a processed document and classify the chunks into topics.
 
-        Args:
-            doc: ProcessedDocument from PDFProcessor or ASPXProcessor
+        Has no side effects on the chunk store or registry, so it can also
+        run in worker processes (see index_directory).
 
         Returns:
-            IndexingResult with chunks and metadata
+            Tuple of (indexed_chunks, document topics)
         """
-        import time
-        start_time = time.time()
-
-        filepath = doc.filepath
-        path = Path(filepath)
-
-        # Check if already indexed and up-to-date
-        if self.registry.is_indexed(filepath) and not self.registry.needs_update(filepath):
-            logger.info(f"Skipping {path.name} - already indexed")
-            return IndexingResult(
-                filepath=filepath,
-                filename=path.name,
-                success=True,
-                error="Already indexed (skipped)",
-            )
-
-        if doc.error:
-            self.registry.register_failed(filepath, doc.error)
-            return IndexingResult(
-                filepath=filepath,
-                filename=path.name,
-                success=False,
-                error=doc.error,
-            )
+        indexed_chunks = []
+        topic_counts = Counter()
+        for indexed_chunk, chunk_topics in DocumentIndexer._iter_chunks(
+            doc, doc_metadata, chunker, taxonomy
+        ):
+            indexed_chunks.append(indexed_chunk)
+            topic_counts.update(chunk_topics)
+        return indexed_chunks, _top_topics(topic_counts)
+
+    @staticmethod
+    def _iter_chunks(
+        doc: ProcessedDocument,
+        doc_metadata: dict,
+        chunker: AdaptiveChunker,
+        taxonomy: TopicTaxonomy,
+    ) -> Iterator[tuple[IndexedChunk, list[str]]]:
+        """
+        Yield (IndexedChunk, all matched topics) for each chunk of a document.
 
-        # Use domain from document or infer from filepath
-        domain = doc.domain or self.taxonomy.get_domain_from_filepath(filepath)
+        IndexedChunk.topics keeps the top 5; the full list feeds the
+        document-level topics.
+        """
+        # Shared by every chunk of the document (and domain across documents)
+        filepath = sys.intern(doc_metadata["source_file"])
+        filename = sys.intern(doc_metadata["source_filename"])
+        domain = doc_metadata["domain"] and sys.intern(doc_metadata["domain"])
 
         # Build section map from structured items
-        section_map = self._build_section_map(doc)
+        section_map = DocumentIndexer._build_section_map(doc)
 
         # Chunk the document
-        page_texts = doc.get_page_texts()
-        doc_metadata = {
-            "source_file": filepath,
-            "source_filename": path.name,
-            "domain": domain,
-            "source_type": doc.metadata.get("source_type", "pdf"),
-            "url": doc.metadata.get("url", ""),
-        }
-
-        raw_chunks = self.chunker.chunk_document(
-            pages=page_texts,
+        raw_chunks = chunker.chunk_document(
+            pages=doc.get_page_texts_iter(),
             doc_metadata=doc_metadata,
             carry_context_across_pages=True,
         )
 
-        # Create IndexedChunks with topic classification and structure
-        indexed_chunks = []
-        all_topics = set()
+        # Deterministic ids: the filepath hash keeps same-named files apart
+        # (e.g. ASPX page_001.json in several domains)
+        id_prefix = DocumentIndexer._chunk_id_prefix(filepath)
+
+        # One timestamp for the whole document
+        indexed_at = datetime.now().isoformat()
 
-        for chunk in raw_chunks:
-            chunk_id = f"{path.stem}_{uuid.uuid4().hex[:8]}"
+        # Classify all chunk texts into topics in one batch
+        raw_texts = [chunk.get("raw_text", chunk["text"]) for chunk in raw_chunks]
+        topics_per_chunk = taxonomy.classify_texts(raw_texts)
 
-            # Classify chunk text into topics
-            chunk_topics = self.taxonomy.classify_text(chunk.get("raw_text", ""))
-            all_topics.update(chunk_topics)
+        for chunk, raw_text, chunk_topics in zip(raw_chunks, raw_texts, topics_per_chunk):
+            chunk_id = f"{id_prefix}_{chunk['metadata']['global_chunk_index']:05d}"
 
             # Get section path for this chunk
             page_num = chunk["metadata"]["page"]
             section_path = section_map.get(page_num, [])
 
             # Detect content type from chunk text
-            raw_text = chunk.get("raw_text", chunk["text"])
-            content_type = "text"
-            has_table = False
-            if raw_text.strip().startswith("|") or "[טבלה]" in raw_text:
-                content_type = "table"
-                has_table = True
-            elif raw_text.strip().startswith("•") or raw_text.strip().startswith("-"):
-                content_type = "list"
-            elif raw_text.strip().startswith("##"):
-                content_type = "header"
+            content_type, has_table = _detect_content_type(raw_text)
 
             indexed_chunk = IndexedChunk(
                 id=chunk_id,
                 text=chunk["text"],
-                raw_text=chunk.get("raw_text", chunk["text"]),
+                raw_text=raw_text,
                 source_file=filepath,
-                source_filename=path.name,
+                source_filename=filename,
                 page_num=page_num,
                 chunk_index=chunk["metadata"]["chunk_index"],
                 domain=domain,
-                topics=chunk_topics[:5],
+                topics=chunk_topics[:5],  # Top 5 topics
                 section_path=section_path,
                 content_type=content_type,
                 has_table=has_table,
@@ -301,32 +441,52 @@ class DocumentIndexer:
                 chunk_size_used=chunk["metadata"]["chunk_size_used"],
                 has_context=chunk["metadata"]["has_context"],
                 previous_summary=chunk.get("previous_summary", ""),
+                indexed_at=indexed_at,
             )
-            indexed_chunks.append(indexed_chunk)
+            yield indexed_chunk, chunk_topics
+
+    @staticmethod
+    def _process_pdf(
+        filepath: str,
+        pdf_processor: PDFProcessor,
+        chunker: AdaptiveChunker,
+        taxonomy: TopicTaxonomy,
+        doc: Optional[ProcessedDocument] = None,
+    ) -> IndexingResult:
+        """
+        Process, chunk and classify a single PDF.
 
-        # Store chunks
-        for chunk in indexed_chunks:
-            self._chunks_store[chunk.id] = chunk.to_dict()
+        The returned IndexingResult carries everything _store_result() needs,
+        so this runs unchanged in a worker process.
 
-        # Register in document registry
-        chunk_ids = [c.id for c in indexed_chunks]
-        self.registry.register_indexed(
-            filepath=filepath,
-            chunk_ids=chunk_ids,
-            page_count=doc.page_count,
-            domain=domain,
-            topics=list(all_topics)[:10],
-        )
+        Args:
+            doc: The already parsed PDF, if it was parsed ahead (see _index_files_serial)
+        """
+        start_time = time.time()
+        path = Path(filepath)
 
-        # Save chunks to disk
-        self._save_chunks()
+        # Step 1: Process PDF
+        if doc is None:
+            doc = pdf_processor.process(filepath)
+        if doc.error:
+            return IndexingResult(
+                filepath=filepath,
+                filename=path.name,
+                success=False,
+                error=doc.error,
+            )
 
-        processing_time = (time.time() - start_time) * 1000
+        # Step 2: Infer domain from filename
+        domain = taxonomy.get_domain_from_filepath(filepath)
 
-        logger.info(
-            f"Indexed {path.name}: {doc.page_count} pages, "
-            f"{len(indexed_chunks)} chunks, {doc.total_chars} chars, "
-            f"{processing_time:.0f}ms"
+        # Steps 3-5: Section map, chunking, topic classification
+        doc_metadata = {
+            "source_file": filepath,
+            "source_filename": path.name,
+            "domain": domain,
+        }
+        indexed_chunks, doc_topics = DocumentIndexer._build_chunks(
+            doc, doc_metadata, chunker, taxonomy
         )
 
         return IndexingResult(
@@ -338,165 +498,231 @@ class DocumentIndexer:
             chunk_count=len(indexed_chunks),
             total_chars=doc.total_chars,
             domain=domain,
-            topics=list(all_topics)[:10],
-            processing_time_ms=processing_time,
+            topics=doc_topics,
+            processing_time_ms=(time.time() - start_time) * 1000,
         )
 
-    def index_document(self, filepath: str) -> IndexingResult:
+    def _is_up_to_date(self, filepath: str, file_hash: str) -> bool:
+        """Check if a document (under its registry key) is already indexed and unchanged."""
+        return self.registry.is_indexed(filepath, file_hash) and not self.registry.needs_update(
+            filepath, file_hash
+        )
+
+    @staticmethod
+    def _skipped_result(filepath: str) -> IndexingResult:
+        """Result for a document that is already indexed."""
+        logger.info(f"Skipping {Path(filepath).name} - already indexed")
+        return IndexingResult(
+            filepath=filepath,
+            filename=Path(filepath).name,
+            success=True,
+            error="Already indexed (skipped)",
+        )
+
+    def _store_result(
+        self,
+        result: IndexingResult,
+        file_hash: Optional[str] = None,
+        st: Optional[os.stat_result] = None,
+    ):
         """
-        Index a single document through the full pipeline.
-        
+        Merge an IndexingResult into the chunk store and document registry.
+
+        Failed results are registered as failed; successful ones have their
+        chunks stored and appended to the NDJSON log. file_hash and st are
+        the registry key and stat resolved before indexing (get_file_key()),
+        so the file isn't looked up (or hashed) again.
+        """
+        if not result.success:
+            self.registry.register_failed(result.filepath, result.error, file_hash, st)
+            return
+
+        chunk_ids = []
+        for chunk in result.chunks:
+            self._chunks_store[chunk.id] = chunk.to_dict()
+            chunk_ids.append(chunk.id)
+        self._dirty_ids.update(chunk_ids)
+
+        # Register in document registry
+        self.registry.register_indexed(
+            filepath=result.filepath,
+            chunk_ids=chunk_ids,
+            page_count=result.page_count,
+            domain=result.domain,
+            topics=result.topics,
+            file_hash=file_hash,
+            st=st,
+        )
+
+        # Append new chunks to the log; finalize() writes chunks.json
+        self._append_chunks(result.chunks)
+
+        logger.info(
+            f"Indexed {result.filename}: {result.page_count} pages, "
+            f"{result.chunk_count} chunks, {result.total_chars} chars, "
+            f"{result.processing_time_ms:.0f}ms"
+        )
+
+    def index_processed_document(self, doc: ProcessedDocument) -> IndexingResult:
+        """
+        Index a pre-processed document (PDF or ASPX).
+
         Args:
-            filepath: Path to PDF file
-            
+            doc: ProcessedDocument from PDFProcessor or ASPXProcessor
+
         Returns:
             IndexingResult with chunks and metadata
         """
-        import time
         start_time = time.time()
-        
+
+        filepath = doc.filepath
         path = Path(filepath)
-        
+
         # Check if already indexed and up-to-date
-        if self.registry.is_indexed(filepath) and not self.registry.needs_update(filepath):
-            logger.info(f"Skipping {path.name} - already indexed")
-            return IndexingResult(
-                filepath=filepath,
-                filename=path.name,
-                success=True,
-                error="Already indexed (skipped)",
-            )
-        
-        # Step 1: Process PDF
-        doc = self.pdf_processor.process(filepath)
+        file_hash, st = self.registry.get_file_key(filepath)
+        if self._is_up_to_date(filepath, file_hash):
+            return self._skipped_result(filepath)
+
         if doc.error:
-            self.registry.register_failed(filepath, doc.error)
+            self.registry.register_failed(filepath, doc.error, file_hash, st)
             return IndexingResult(
                 filepath=filepath,
                 filename=path.name,
                 success=False,
                 error=doc.error,
             )
-        
-        # Step 2: Infer domain from filename
-        domain = self.taxonomy.get_domain_from_filepath(filepath)
 
-        # Step 3: Build section map from structured items
-        # Maps (page_num, char_offset) -> section_path
-        section_map = self._build_section_map(doc)
+        # Use domain from document or infer from filepath
+        domain = doc.domain or self.taxonomy.get_domain_from_filepath(filepath)
 
-        # Step 4: Chunk the document
-        page_texts = doc.get_page_texts()
         doc_metadata = {
             "source_file": filepath,
             "source_filename": path.name,
             "domain": domain,
+            "source_type": doc.metadata.get("source_type", "pdf"),
+            "url": doc.metadata.get("url", ""),
         }
+        indexed_chunks, doc_topics = self._build_chunks(
+            doc, doc_metadata, self.chunker, self.taxonomy
+        )
 
-        raw_chunks = self.chunker.chunk_document(
-            pages=page_texts,
-            doc_metadata=doc_metadata,
-            carry_context_across_pages=True,
+        result = IndexingResult(
+            filepath=filepath,
+            filename=path.name,
+            success=True,
+            chunks=indexed_chunks,
+            page_count=doc.page_count,
+            chunk_count=len(indexed_chunks),
+            total_chars=doc.total_chars,
+            domain=domain,
+            topics=doc_topics,
+            processing_time_ms=(time.time() - start_time) * 1000,
         )
+        self._store_result(result, file_hash, st)
+        return result
 
-        # Step 5: Create IndexedChunks with topic classification and structure
-        indexed_chunks = []
-        all_topics = set()
+    def index_document(self, filepath: str) -> IndexingResult:
+        """
+        Index a single document through the full pipeline.
 
-        for chunk in raw_chunks:
-            chunk_id = f"{path.stem}_{uuid.uuid4().hex[:8]}"
+        Args:
+            filepath: Path to PDF file
 
-            # Classify chunk text into topics
-            chunk_topics = self.taxonomy.classify_text(chunk.get("raw_text", ""))
-            all_topics.update(chunk_topics)
+        Returns:
+            IndexingResult with chunks and metadata
+        """
+        # Check if already indexed and up-to-date
+        file_hash, st = self.registry.get_file_key(filepath)
+        if self._is_up_to_date(filepath, file_hash):
+            return self._skipped_result(filepath)
 
-            # Get section path for this chunk
-            page_num = chunk["metadata"]["page"]
-            section_path = section_map.get(page_num, [])
+        result = self._process_pdf(filepath, self.pdf_processor, self.chunker, self.taxonomy)
+        self._store_result(result, file_hash, st)
+        return result
 
-            # Detect content type from chunk text
-            raw_text = chunk.get("raw_text", chunk["text"])
-            content_type = "text"
-            has_table = False
-            if raw_text.strip().startswith("|") or "[טבלה]" in raw_text:
-                content_type = "table"
-                has_table = True
-            elif raw_text.strip().startswith("•") or raw_text.strip().startswith("-"):
-                content_type = "list"
-            elif raw_text.strip().startswith("##"):
-                content_type = "header"
+    def index_document_iter(self, filepath: str) -> Iterator[IndexedChunk]:
+        """
+        Index a single PDF, yielding each chunk as soon as it is stored.
 
-            indexed_chunk = IndexedChunk(
-                id=chunk_id,
-                text=chunk["text"],
-                raw_text=chunk.get("raw_text", chunk["text"]),
-                source_file=filepath,
-                source_filename=path.name,
-                page_num=page_num,
-                chunk_index=chunk["metadata"]["chunk_index"],
-                domain=domain,
-                topics=chunk_topics[:5],  # Top 5 topics
-                section_path=section_path,
-                content_type=content_type,
-                has_table=has_table,
-                char_count=chunk["metadata"]["char_count"],
-                chunk_size_used=chunk["metadata"]["chunk_size_used"],
-                has_context=chunk["metadata"]["has_context"],
-                previous_summary=chunk.get("previous_summary", ""),
-            )
-            indexed_chunks.append(indexed_chunk)
+        Each chunk is added to the chunk store and NDJSON log before it is
+        yielded, so a downstream consumer (e.g. batched embedding) can work
+        through a large document without an IndexingResult holding every
+        chunk. The document is registered once the iterator is exhausted;
+        an abandoned iterator leaves it unregistered (re-indexed next run).
+        Skipped and failed documents yield nothing.
 
-        # Step 5: Store chunks
-        for chunk in indexed_chunks:
-            self._chunks_store[chunk.id] = chunk.to_dict()
+        Args:
+            filepath: Path to PDF file
 
-        # Step 6: Register in document registry
-        chunk_ids = [c.id for c in indexed_chunks]
-        self.registry.register_indexed(
-            filepath=filepath,
-            chunk_ids=chunk_ids,
-            page_count=doc.page_count,
-            domain=domain,
-            topics=list(all_topics)[:10],
-        )
+        Yields:
+            IndexedChunk objects in document order
+        """
+        # Check if already indexed and up-to-date
+        file_hash, st = self.registry.get_file_key(filepath)
+        if self._is_up_to_date(filepath, file_hash):
+            self._skipped_result(filepath)
+            return
 
-        # Save chunks to disk
-        self._save_chunks()
+        doc = self.pdf_processor.process(filepath)
+        if doc.error:
+            self.registry.register_failed(filepath, doc.error, file_hash, st)
+            return
 
-        processing_time = (time.time() - start_time) * 1000
+        path = Path(filepath)
+        domain = self.taxonomy.get_domain_from_filepath(filepath)
+        doc_metadata = {
+            "source_file": filepath,
+            "source_filename": path.name,
+            "domain": domain,
+        }
 
-        logger.info(
-            f"Indexed {path.name}: {doc.page_count} pages, "
-            f"{len(indexed_chunks)} chunks, {doc.total_chars} chars, "
-            f"{processing_time:.0f}ms"
-        )
+        chunk_ids = []
+        topic_counts = Counter()
+        self.chunks_log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.chunks_log_path, "ab") as log:
+            for indexed_chunk, chunk_topics in self._iter_chunks(
+                doc, doc_metadata, self.chunker, self.taxonomy
+            ):
+                chunk_dict = indexed_chunk.to_dict()
+                self._chunks_store[indexed_chunk.id] = chunk_dict
+                self._dirty_ids.add(indexed_chunk.id)
+                log.write(orjson.dumps(chunk_dict) + b"\n")
+                chunk_ids.append(indexed_chunk.id)
+                topic_counts.update(chunk_topics)
+                yield indexed_chunk
 
-        return IndexingResult(
+        self.registry.register_indexed(
             filepath=filepath,
-            filename=path.name,
-            success=True,
-            chunks=indexed_chunks,
+            chunk_ids=chunk_ids,
             page_count=doc.page_count,
-            chunk_count=len(indexed_chunks),
-            total_chars=doc.total_chars,
             domain=domain,
-            topics=list(all_topics)[:10],
-            processing_time_ms=processing_time,
+            topics=_top_topics(topic_counts),
+            file_hash=file_hash,
+            st=st,
         )
+        logger.info(f"Indexed {path.name}: {doc.page_count} pages, {len(chunk_ids)} chunks (streamed)")
 
     def index_directory(
         self,
         directory: str,
         pattern: str = "*.pdf",
         skip_indexed: bool = True,
+        max_workers: Optional[int] = None,
     ) -> list[IndexingResult]:
         """
         Index all PDFs in a directory.
 
+        PDF processing, chunking and classification run in a process pool;
+        the chunk store and registry are only updated here in the parent,
+        in file order. New chunks go to the NDJSON log; chunks.json and the
+        registry are rewritten every FINALIZE_EVERY_DOCS documents and once
+        at the end, not per document.
+
         Args:
             directory: Path to directory containing PDFs
             pattern: Glob pattern for matching files
             skip_indexed: Skip already indexed files
+            max_workers: Worker processes (None = CPU count, 1 = serial)
 
         Returns:
             List of IndexingResult objects
@@ -514,20 +740,14 @@ class DocumentIndexer:
 
         logger.info(f"Indexing {len(pdf_files)} files from {directory}")
 
-        results = []
-        for i, pdf_path in enumerate(pdf_files):
-            logger.info(f"[{i+1}/{len(pdf_files)}] Processing {Path(pdf_path).name}")
-            try:
-                result = self.index_document(pdf_path)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to index {pdf_path}: {e}")
-                results.append(IndexingResult(
-                    filepath=pdf_path,
-                    filename=Path(pdf_path).name,
-                    success=False,
-                    error=str(e),
-                ))
+        workers = min(max_workers or os.cpu_count() or 1, len(pdf_files))
+        with self.registry.batch():
+            if workers <= 1:
+                results = self._index_files_serial(pdf_files)
+            else:
+                results = self._index_files_parallel(pdf_files, workers)
+
+        self.finalize()
 
         # Summary
         successful = sum(1 for r in results if r.success)
@@ -536,10 +756,157 @@ class DocumentIndexer:
 
         return results
 
+    def _index_files_serial(self, pdf_files: list[str]) -> list[IndexingResult]:
+        """
+        Index files one by one in this process.
+
+        The next PDF is parsed in a background thread while the current one
+        is chunked and classified; PDF parsing spends most of its time in
+        native code outside the GIL. At most one PDF is parsed at a time.
+        """
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as parser:
+            parsed_ahead = self._parse_ahead(parser, pdf_files[0]) if pdf_files else None
+            for i, pdf_path in enumerate(pdf_files):
+                logger.info(f"[{i+1}/{len(pdf_files)}] Processing {Path(pdf_path).name}")
+                current, parsed_ahead = parsed_ahead, None
+                try:
+                    if current is None:
+                        result = self.index_document(pdf_path)
+                    else:
+                        file_hash, st, parsing = current
+                        doc = parsing.result()
+                        if i + 1 < len(pdf_files):
+                            parsed_ahead = self._parse_ahead(parser, pdf_files[i + 1])
+                        result = self._process_pdf(
+                            pdf_path, self.pdf_processor, self.chunker, self.taxonomy, doc
+                        )
+                        self._store_result(result, file_hash, st)
+                    results.append(result)
+                except Exception as e:
+                    logger.error(f"Failed to index {pdf_path}: {e}")
+                    results.append(_error_result(pdf_path, e))
+                if parsed_ahead is None and i + 1 < len(pdf_files):
+                    parsed_ahead = self._parse_ahead(parser, pdf_files[i + 1])
+                self._checkpoint(i + 1)
+        return results
+
+    def _parse_ahead(
+        self, parser: ThreadPoolExecutor, pdf_path: str
+    ) -> Optional[tuple[str, os.stat_result, Future]]:
+        """
+        Start parsing a PDF in the parser thread, unless it is already indexed.
+
+        Returns:
+            (file_hash, stat, future ProcessedDocument), or None to leave the file
+            to index_document() (up to date or unreadable)
+        """
+        try:
+            file_hash, st = self.registry.get_file_key(pdf_path)
+        except OSError:
+            return None
+        if self._is_up_to_date(pdf_path, file_hash):
+            return None
+        return file_hash, st, parser.submit(self.pdf_processor.process, pdf_path)
+
+    def _index_files_parallel(self, pdf_files: list[str], workers: int) -> list[IndexingResult]:
+        """
+        Index files in worker processes, merging each result as it is collected.
+
+        At most PARALLEL_IN_FLIGHT_PER_WORKER files per worker are submitted
+        ahead of the one being merged, so finished results don't pile up in
+        memory behind a slow PDF. Results are merged in file order.
+        """
+        results = []
+        pending: deque[tuple[str, Optional[str], Optional[os.stat_result], Optional[Future]]] = deque()
+        max_in_flight = workers * PARALLEL_IN_FLIGHT_PER_WORKER
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.pdf_processor.use_ocr, self.taxonomy),
+        ) as executor, tqdm(total=len(pdf_files), desc="Indexing") as progress:
+            for pdf_path in pdf_files:
+                try:
+                    file_hash, st = self.registry.get_file_key(pdf_path)
+                except OSError as e:
+                    # Vanished or unreadable: fail this file in order, keep the run going
+                    failed = Future()
+                    failed.set_exception(e)
+                    pending.append((pdf_path, None, None, failed))
+                else:
+                    if self._is_up_to_date(pdf_path, file_hash):
+                        pending.append((pdf_path, file_hash, st, None))
+                    else:
+                        future = executor.submit(_index_pdf_worker, pdf_path)
+                        pending.append((pdf_path, file_hash, st, future))
+                if len(pending) >= max_in_flight:
+                    self._collect_result(*pending.popleft(), results)
+                    progress.update()
+
+            while pending:
+                self._collect_result(*pending.popleft(), results)
+                progress.update()
+
+        return results
+
+    def _collect_result(
+        self,
+        pdf_path: str,
+        file_hash: Optional[str],
+        st: Optional[os.stat_result],
+        future: Optional[Future],
+        results: list[IndexingResult],
+    ):
+        """Wait for a worker result (None = skipped file), merge it and checkpoint."""
+        if future is None:
+            results.append(self._skipped_result(pdf_path))
+        else:
+            try:
+                result = future.result()
+                self._store_result(result, file_hash, st)
+                results.append(result)
+            except Exception as e:
+                logger.error(f"Failed to index {pdf_path}: {e}")
+                results.append(_error_result(pdf_path, e))
+        self._checkpoint(len(results))
+
+    def _checkpoint(self, docs_done: int):
+        """Periodically write chunks.json and the registry during a long index_directory run."""
+        if docs_done % FINALIZE_EVERY_DOCS == 0:
+            self.finalize()
+            self.registry.flush()
+
     def get_all_chunks(self) -> list[dict]:
         """Get all indexed chunks from the chunk store."""
         return list(self._chunks_store.values())
 
+    def get_chunk_columns(self, *names: str) -> dict[str, list | np.ndarray]:
+        """
+        Get chunk fields as columns, one value per stored chunk in store order.
+
+        Integer fields (page_num, char_count, ...) come back as int32 NumPy
+        arrays, other fields as lists, so bulk scans (per-domain counts,
+        page filters, size stats) work on a few columns instead of walking
+        every chunk dict.
+
+        Args:
+            names: Chunk fields to extract (e.g. "domain", "page_num")
+
+        Returns:
+            Dict mapping field name -> column
+        """
+        chunks = self._chunks_store.values()
+        columns: dict[str, list | np.ndarray] = {}
+        for name in names:
+            if name in _NUMERIC_CHUNK_KEYS:
+                columns[name] = np.fromiter(
+                    (chunk.get(name, 0) for chunk in chunks), dtype=np.int32, count=len(chunks)
+                )
+            else:
+                columns[name] = [chunk.get(name) for chunk in chunks]
+        return columns
+
     def get_chunk_count(self) -> int:
         """Get total number of stored chunks."""
         return len(self._chunks_store)
@@ -551,6 +918,35 @@ class DocumentIndexer:
         return stats
 
 
+
+def _error_result(filepath: str, error: Exception) -> IndexingResult:
+    """Result for a document whose indexing raised."""
+    return IndexingResult(
+        filepath=filepath,
+        filename=Path(filepath).name,
+        success=False,
+        error=str(error),
+    )
+
+
+# Worker-process state for index_directory (set once per process by the initializer)
+_worker_pdf_processor: Optional[PDFProcessor] = None
+_worker_chunker: Optional[AdaptiveChunker] = None
+_worker_taxonomy: Optional[TopicTaxonomy] = None
+
+
+def _init_worker(use_ocr: bool, taxonomy: TopicTaxonomy) -> None:
+    global _worker_pdf_processor, _worker_chunker, _worker_taxonomy
+    _worker_pdf_processor = PDFProcessor(use_ocr=use_ocr)
+    _worker_chunker = AdaptiveChunker(doc_type="pdf")
+    _worker_taxonomy = taxonomy
+
+
+def _index_pdf_worker(filepath: str) -> IndexingResult:
+    return DocumentIndexer._process_pdf(
+        filepath, _worker_pdf_processor, _worker_chunker, _worker_taxonomy
+    )
+
 # Quick test
 if __name__ == "__main__":
     import json
@@ -565,6 +961,7 @@ if __name__ == "__main__":
 
     if pdfs:
         result = indexer.index_document(str(pdfs[0]))
+        indexer.finalize()
         print(f"\nResult: {result.filename}")
         print(f"  Success: {result.success}")
         print(f"  Pages: {result.page_count}")
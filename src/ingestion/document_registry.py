@@ -7,18 +7,85 @@ Enables incremental indexing:
 - Support add/update/remove operations
 """
 
+import fnmatch
 import hashlib
-import json
 import logging
+import os
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field, asdict
 
+import orjson
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Read size for file hashing (large reads keep the loop in the hasher, not Python)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Hash for new registries: only change detection, so the fastest available
+DEFAULT_HASH_ALGO = "blake3" if BLAKE3_AVAILABLE else "sha256"
+
+
+def _hash_algo_available(hash_algo: str) -> bool:
+    return hash_algo == "sha256" or (hash_algo == "blake3" and BLAKE3_AVAILABLE)
+
+
+@lru_cache(maxsize=4096)
+def _hash_file(path: str, mtime_ns: int, size: int, hash_algo: str = "sha256") -> str:
+    """
+    Hash of a file's content (hash_algo: "sha256" or "blake3").
+
+    Cached per (path, mtime, size): is_indexed(), needs_update() and
+    register_*() all hash the same file, which is then only read once.
+    """
+    hasher = blake3.blake3() if hash_algo == "blake3" else hashlib.sha256()
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            # Whole-file sequential read: let the kernel read ahead further
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(byte_block)
+    return hasher.hexdigest()
+
+
+def _pack_chunk_ids(chunk_ids: list[str]) -> Optional[str]:
+    """
+    Common prefix of chunk ids of the form {prefix}_{i:05d} (i = 0..n-1).
+
+    Returns None if the ids don't follow that scheme; they are then stored
+    as a list.
+    """
+    if not chunk_ids:
+        return None
+    prefix = chunk_ids[0].rpartition("_")[0]
+    if not prefix or chunk_ids != _unpack_chunk_ids(prefix, len(chunk_ids)):
+        return None
+    return prefix
+
+
+def _unpack_chunk_ids(prefix: str, count: int) -> list[str]:
+    """Rebuild the chunk ids stored as a prefix and a count."""
+    return [f"{prefix}_{i:05d}" for i in range(count)]
+
 
-@dataclass
+def _doc_chunk_ids(doc: dict) -> list[str]:
+    """Chunk ids of a stored document dict (packed or list form)."""
+    prefix = doc.get("chunk_id_prefix")
+    if prefix is not None:
+        return _unpack_chunk_ids(prefix, doc["chunk_count"])
+    return doc.get("chunk_ids", [])
+
+
+@dataclass(slots=True)
 class DocumentRecord:
     """Record of an indexed document."""
     file_hash: str
@@ -27,6 +94,7 @@ class DocumentRecord:
     status: str  # "indexed", "pending", "failed", "deleted"
     indexed_at: Optional[str] = None
     file_size: int = 0
+    mtime_ns: int = 0  # File mtime when registered (with file_size: skip rehashing)
     page_count: int = 0
     chunk_count: int = 0
     chunk_ids: list = field(default_factory=list)
@@ -34,13 +102,22 @@ class DocumentRecord:
     topics: list = field(default_factory=list)
     schema_version: str = "1.0"
     error_message: Optional[str] = None
+    chunk_id_prefix: Optional[str] = None  # Stored instead of chunk_ids when they are {prefix}_{i:05d}
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        data = asdict(self)
+        prefix = _pack_chunk_ids(self.chunk_ids)
+        data["chunk_id_prefix"] = prefix
+        if prefix is not None:
+            data["chunk_ids"] = []
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "DocumentRecord":
-        return cls(**data)
+        record = cls(**data)
+        if record.chunk_id_prefix is not None:
+            record.chunk_ids = _unpack_chunk_ids(record.chunk_id_prefix, record.chunk_count)
+        return record
 
 
 class DocumentRegistry:
@@ -56,20 +133,69 @@ class DocumentRegistry:
 
     SCHEMA_VERSION = "1.0"
 
-    def __init__(self, registry_path: str = "data/processed/registry.json"):
+    def __init__(
+        self,
+        registry_path: str = "data/processed/registry.json",
+        hash_algo: Optional[str] = None,
+        indent: bool = False,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            registry_path: Path to registry JSON
+            hash_algo: File hash used as document key ("blake3" or "sha256").
+                None keeps the registry's current algorithm (new registries
+                use blake3 when installed). Records keyed by a previous
+                algorithm are re-keyed lazily when their file is looked up.
+            indent: Write indented JSON (for reading/diffing by hand). Off by
+                default: indenting doubles serialization time and adds ~40%
+                to the file.
+        """
         self.registry_path = Path(registry_path)
+        self.indent = indent
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
         self._registry = self._load_registry()
+        # Inside batch(), changes are only written by flush() / on exit
+        self._autosave = True
+        self._dirty = False
+
+        # Registries written before hash_algo was recorded use SHA256
+        current_algo = self._registry.setdefault("hash_algo", "sha256")
+        hash_algo = hash_algo or current_algo
+        if not _hash_algo_available(hash_algo):
+            logger.warning(f"Hash algorithm {hash_algo} not available, using sha256")
+            hash_algo = "sha256"
+        if hash_algo != current_algo:
+            legacy = self._registry.setdefault("legacy_hash_algos", [])
+            if current_algo not in legacy:
+                legacy.append(current_algo)
+            if hash_algo in legacy:
+                legacy.remove(hash_algo)
+            self._registry["hash_algo"] = hash_algo
+        self.hash_algo = hash_algo
+
+        # Absolute filepath -> file hash, so unchanged files are found by stat()
+        # instead of by hashing their content
+        self._path_index = {
+            doc["filepath"]: file_hash
+            for file_hash, doc in self._registry["documents"].items()
+        }
+
+        # Domain -> file hashes (insertion-ordered), for per-domain queries
+        self._domain_index: dict[Optional[str], dict[str, None]] = {}
+        for file_hash, doc in self._registry["documents"].items():
+            self._domain_index.setdefault(doc.get("domain"), {})[file_hash] = None
 
     def _load_registry(self) -> dict:
         """Load registry from disk or create new one."""
         if self.registry_path.exists():
-            with open(self.registry_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return orjson.loads(self.registry_path.read_bytes())
         return {
             "version": self.SCHEMA_VERSION,
             "created_at": datetime.now().isoformat(),
             "last_updated": datetime.now().isoformat(),
+            "hash_algo": DEFAULT_HASH_ALGO,
             "documents": {},
             "stats": {
                 "total_documents": 0,
@@ -84,8 +210,44 @@ class DocumentRegistry:
         """Save registry to disk."""
         self._registry["last_updated"] = datetime.now().isoformat()
         self._update_stats()
-        with open(self.registry_path, "w", encoding="utf-8") as f:
-            json.dump(self._registry, f, ensure_ascii=False, indent=2)
+        # orjson emits UTF-8, like ensure_ascii=False
+        option = orjson.OPT_INDENT_2 if self.indent else 0
+
+        # Write a temp file and rename it over the registry, so a crash
+        # mid-write leaves the previous registry intact
+        tmp_path = self.registry_path.with_name(self.registry_path.name + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(self._registry, option=option))
+        os.replace(tmp_path, self.registry_path)
+        self._dirty = False
+
+    def _changed(self):
+        """Persist a change now, or defer it while inside batch()."""
+        if self._autosave:
+            self._save_registry()
+        else:
+            self._dirty = True
+
+    def flush(self):
+        """Write deferred changes (no-op if nothing changed)."""
+        if self._dirty:
+            self._save_registry()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer registry writes until the end of the block.
+
+        Bulk indexing otherwise rewrites registry.json once per document.
+        Changes are flushed on exit (also if the block raises); batches nest.
+        """
+        previous = self._autosave
+        self._autosave = False
+        try:
+            yield self
+        finally:
+            self._autosave = previous
+            if previous:
+                self.flush()
 
     def _update_stats(self):
         """Update statistics based on current documents."""
@@ -101,6 +263,9 @@ class DocumentRegistry:
     def clear(self):
         """Clear all documents from the registry."""
         self._registry["documents"] = {}
+        self._path_index = {}
+        self._domain_index = {}
+        self._registry.pop("legacy_hash_algos", None)
         self._registry["stats"] = {
             "total_documents": 0,
             "total_chunks": 0,
@@ -108,47 +273,161 @@ class DocumentRegistry:
             "pending": 0,
             "failed": 0,
         }
-        self._save_registry()
+        self._changed()
         logger.info("Registry cleared")
 
-    @staticmethod
-    def compute_file_hash(filepath: str) -> str:
-        """Compute SHA256 hash of file content."""
-        sha256_hash = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-
-    def get_document(self, filepath: str) -> Optional[DocumentRecord]:
-        """Get document record by filepath."""
+    def compute_file_hash(self, filepath: str, hash_algo: Optional[str] = None) -> str:
+        """Compute hash of file content (reused while the file is unchanged)."""
+        path = os.path.abspath(filepath)
+        st = os.stat(path)
+        return _hash_file(path, st.st_mtime_ns, st.st_size, hash_algo or self.hash_algo)
+
+    def _document_key(self, filepath: str, st: Optional[os.stat_result] = None) -> str:
+        """
+        Get the registry key (file hash) for a file.
+
+        A registered file with unchanged size and mtime is resolved through
+        the path index without hashing. A record still keyed by a legacy
+        hash algorithm is moved to the current key, so it is found without
+        re-indexing.
+
+        Args:
+            filepath: File to look up
+            st: The file's stat result, if already known (e.g. from scandir)
+        """
+        documents = self._registry["documents"]
+        path = Path(filepath).absolute()
+        if st is None:
+            st = path.stat()
+
+        # Fast path: registered file whose size and mtime are unchanged
+        file_hash = self._path_index.get(str(path))
+        record = documents.get(file_hash)
+        if (
+            record is not None
+            and record.get("mtime_ns") == st.st_mtime_ns
+            and record.get("file_size") == st.st_size
+        ):
+            return file_hash
+
         file_hash = self.compute_file_hash(filepath)
+        record = documents.get(file_hash)
+        if record is not None:
+            if record["filepath"] == str(path):
+                # Same content (e.g. touched file): refresh the stamp, saved with the next write
+                record["mtime_ns"] = st.st_mtime_ns
+                record["file_size"] = st.st_size
+                self._path_index[str(path)] = file_hash
+                self._dirty = True
+            return file_hash
+
+        for legacy_algo in self._registry.get("legacy_hash_algos", []):
+            if not _hash_algo_available(legacy_algo):
+                continue
+            legacy_hash = self.compute_file_hash(filepath, legacy_algo)
+            if legacy_hash in documents:
+                record = documents.pop(legacy_hash)
+                record["file_hash"] = file_hash
+                documents[file_hash] = record
+                self._path_index[record["filepath"]] = file_hash
+                domain_hashes = self._domain_index.setdefault(record.get("domain"), {})
+                domain_hashes.pop(legacy_hash, None)
+                domain_hashes[file_hash] = None
+                self._changed()
+                break
+        return file_hash
+
+    def get_file_key(self, filepath: str) -> tuple[str, os.stat_result]:
+        """
+        Get the registry key (file hash) for a file, with the stat it was taken under.
+
+        Callers that make several registry calls for one file can resolve the
+        key once and pass it as file_hash to the lookup and register methods.
+        Pass the stat result to register_*() as well: the registered
+        size/mtime stamp must describe the content that was hashed, or a
+        file rewritten in between would keep its stale hash.
+        """
+        st = os.stat(filepath)
+        return self._document_key(filepath, st), st
+
+    def _key_and_stat(
+        self,
+        filepath: str,
+        file_hash: Optional[str],
+        st: Optional[os.stat_result],
+    ) -> tuple[str, os.stat_result]:
+        """
+        Registry key and the stat it belongs to, for register_*().
+
+        A file_hash passed without its stat can't be tied to the content it
+        describes, so the file is looked up again (no re-read while it is
+        unchanged: path index / hash cache).
+        """
+        if file_hash is not None and st is not None:
+            return file_hash, st
+        return self.get_file_key(filepath)
+
+    def _put_record(self, record: DocumentRecord):
+        """Store a record under its file hash and index its path and domain."""
+        previous = self._registry["documents"].get(record.file_hash)
+        if previous is not None and previous.get("domain") != record.domain:
+            self._domain_index.get(previous.get("domain"), {}).pop(record.file_hash, None)
+
+        self._registry["documents"][record.file_hash] = record.to_dict()
+        self._path_index[record.filepath] = record.file_hash
+        self._domain_index.setdefault(record.domain, {})[record.file_hash] = None
+
+    def get_document(self, filepath: str, file_hash: Optional[str] = None) -> Optional[DocumentRecord]:
+        """Get document record by filepath (or by its key from get_file_key())."""
+        file_hash = file_hash or self._document_key(filepath)
         if file_hash in self._registry["documents"]:
             return DocumentRecord.from_dict(self._registry["documents"][file_hash])
         return None
 
-    def is_indexed(self, filepath: str) -> bool:
+    def is_indexed(self, filepath: str, file_hash: Optional[str] = None) -> bool:
         """Check if file is already indexed."""
-        doc = self.get_document(filepath)
+        doc = self.get_document(filepath, file_hash)
         return doc is not None and doc.status == "indexed"
 
-    def needs_update(self, filepath: str) -> bool:
+    def needs_update(self, filepath: str, file_hash: Optional[str] = None) -> bool:
         """Check if file needs to be (re)indexed."""
-        path = Path(filepath)
-        if not path.exists():
-            return False
-        doc = self.get_document(filepath)
+        if file_hash is None:
+            if not Path(filepath).exists():
+                return False
+            file_hash = self._document_key(filepath)
+        return self._record_needs_update(file_hash)
+
+    def _record_needs_update(self, file_hash: str) -> bool:
+        """Check if the record under file_hash (if any) needs to be (re)indexed."""
+        doc = self._registry["documents"].get(file_hash)
         if doc is None:
             return True  # New file
-        if doc.status in ("pending", "failed"):
+        if doc.get("status") in ("pending", "failed"):
             return True  # Retry
         return False  # Already indexed
 
     def get_pending_files(self, directory: str, pattern: str = "*.pdf") -> list[str]:
-        """Get list of files that need indexing."""
+        """
+        Get list of files that need indexing.
+
+        Scans the directory once with os.scandir; registered files whose
+        size and mtime are unchanged are skipped without being hashed.
+        """
         dir_path = Path(directory)
-        all_files = list(dir_path.glob(pattern))
-        return [str(f) for f in all_files if self.needs_update(str(f))]
+        if "/" in pattern or os.sep in pattern:
+            # Multi-level patterns need glob
+            all_files = list(dir_path.glob(pattern))
+            return [str(f) for f in all_files if self.needs_update(str(f))]
+
+        pending = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatchcase(entry.name, pattern) or not entry.is_file():
+                    continue
+                filepath = str(dir_path / entry.name)
+                if self._record_needs_update(self._document_key(filepath, entry.stat())):
+                    pending.append(filepath)
+        return pending
 
     def get_all_indexed(self) -> list[DocumentRecord]:
         """Get all indexed documents."""
@@ -158,21 +437,27 @@ class DocumentRegistry:
             if d.get("status") == "indexed"
         ]
 
-    def register_pending(self, filepath: str) -> DocumentRecord:
-        """Register a file as pending indexing."""
+    def register_pending(
+        self,
+        filepath: str,
+        file_hash: Optional[str] = None,
+        st: Optional[os.stat_result] = None,
+    ) -> DocumentRecord:
+        """Register a file as pending indexing (file_hash, st: from get_file_key())."""
         path = Path(filepath)
-        file_hash = self.compute_file_hash(filepath)
+        file_hash, st = self._key_and_stat(filepath, file_hash, st)
 
         record = DocumentRecord(
             file_hash=file_hash,
             filename=path.name,
             filepath=str(path.absolute()),
             status="pending",
-            file_size=path.stat().st_size,
+            file_size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
         )
 
-        self._registry["documents"][file_hash] = record.to_dict()
-        self._save_registry()
+        self._put_record(record)
+        self._changed()
         return record
 
     def register_indexed(
@@ -182,10 +467,19 @@ class DocumentRegistry:
         page_count: int,
         domain: Optional[str] = None,
         topics: Optional[list[str]] = None,
+        file_hash: Optional[str] = None,
+        st: Optional[os.stat_result] = None,
     ) -> DocumentRecord:
-        """Register a successfully indexed document."""
+        """
+        Register a successfully indexed document.
+
+        Pass file_hash and st (from get_file_key() before indexing) to
+        register the content that was actually indexed without hashing the
+        file again. If the file changed meanwhile, its stamp no longer
+        matches and the next run re-hashes and re-indexes it.
+        """
         path = Path(filepath)
-        file_hash = self.compute_file_hash(filepath)
+        file_hash, st = self._key_and_stat(filepath, file_hash, st)
 
         record = DocumentRecord(
             file_hash=file_hash,
@@ -193,7 +487,8 @@ class DocumentRegistry:
             filepath=str(path.absolute()),
             status="indexed",
             indexed_at=datetime.now().isoformat(),
-            file_size=path.stat().st_size,
+            file_size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
             page_count=page_count,
             chunk_count=len(chunk_ids),
             chunk_ids=chunk_ids,
@@ -202,29 +497,36 @@ class DocumentRegistry:
             schema_version=self.SCHEMA_VERSION,
         )
 
-        self._registry["documents"][file_hash] = record.to_dict()
-        self._save_registry()
+        self._put_record(record)
+        self._changed()
         return record
 
-    def register_failed(self, filepath: str, error_message: str) -> DocumentRecord:
-        """Register a failed indexing attempt."""
+    def register_failed(
+        self,
+        filepath: str,
+        error_message: str,
+        file_hash: Optional[str] = None,
+        st: Optional[os.stat_result] = None,
+    ) -> DocumentRecord:
+        """Register a failed indexing attempt (file_hash, st: from get_file_key())."""
         path = Path(filepath)
-        file_hash = self.compute_file_hash(filepath)
+        file_hash, st = self._key_and_stat(filepath, file_hash, st)
 
         record = DocumentRecord(
             file_hash=file_hash,
             filename=path.name,
             filepath=str(path.absolute()),
             status="failed",
-            file_size=path.stat().st_size,
+            file_size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
             error_message=error_message,
         )
 
-        self._registry["documents"][file_hash] = record.to_dict()
-        self._save_registry()
+        self._put_record(record)
+        self._changed()
         return record
 
-    def remove_document(self, filepath: str) -> Optional[list[str]]:
+    def remove_document(self, filepath: str, file_hash: Optional[str] = None) -> Optional[list[str]]:
         """
         Remove document from registry.
 
@@ -232,24 +534,27 @@ class DocumentRegistry:
             List of chunk IDs that should be removed from vector DB,
             or None if document not found.
         """
-        file_hash = self.compute_file_hash(filepath)
+        file_hash = file_hash or self._document_key(filepath)
 
         if file_hash not in self._registry["documents"]:
             return None
 
         doc = self._registry["documents"].pop(file_hash)
-        self._save_registry()
-        return doc.get("chunk_ids", [])
+        if self._path_index.get(doc["filepath"]) == file_hash:
+            del self._path_index[doc["filepath"]]
+        self._domain_index.get(doc.get("domain"), {}).pop(file_hash, None)
+        self._changed()
+        return _doc_chunk_ids(doc)
 
-    def mark_deleted(self, filepath: str) -> bool:
+    def mark_deleted(self, filepath: str, file_hash: Optional[str] = None) -> bool:
         """Mark a document as deleted (soft delete)."""
-        file_hash = self.compute_file_hash(filepath)
+        file_hash = file_hash or self._document_key(filepath)
 
         if file_hash not in self._registry["documents"]:
             return False
 
         self._registry["documents"][file_hash]["status"] = "deleted"
-        self._save_registry()
+        self._changed()
         return True
 
     def get_stats(self) -> dict:
@@ -257,20 +562,24 @@ class DocumentRegistry:
         self._update_stats()
         return self._registry["stats"]
 
-    def get_documents_by_domain(self, domain: str) -> list[DocumentRecord]:
-        """Get all documents for a specific domain."""
+    def _indexed_docs_in_domain(self, domain: str) -> list[dict]:
+        """Indexed document dicts for a domain, via the domain index."""
+        documents = self._registry["documents"]
         return [
-            DocumentRecord.from_dict(d)
-            for d in self._registry["documents"].values()
-            if d.get("domain") == domain and d.get("status") == "indexed"
+            doc
+            for doc in map(documents.__getitem__, self._domain_index.get(domain, ()))
+            if doc.get("status") == "indexed"
         ]
 
+    def get_documents_by_domain(self, domain: str) -> list[DocumentRecord]:
+        """Get all documents for a specific domain."""
+        return [DocumentRecord.from_dict(d) for d in self._indexed_docs_in_domain(domain)]
+
     def get_chunk_ids_by_domain(self, domain: str) -> list[str]:
         """Get all chunk IDs for a specific domain."""
         chunk_ids = []
-        for doc in self._registry["documents"].values():
-            if doc.get("domain") == domain and doc.get("status") == "indexed":
-                chunk_ids.extend(doc.get("chunk_ids", []))
+        for doc in self._indexed_docs_in_domain(domain):
+            chunk_ids.extend(_doc_chunk_ids(doc))
         return chunk_ids
 
     def cleanup_missing_files(self) -> list[str]:
@@ -288,7 +597,7 @@ class DocumentRegistry:
                     deleted.append(doc["filepath"])
 
         if deleted:
-            self._save_registry()
+            self._changed()
         return deleted
 
     def __repr__(self) -> str:
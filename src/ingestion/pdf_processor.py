@@ -8,15 +8,23 @@ Extracts text from PDFs with structure preservation:
 - Header/section detection for ToC
 """
 
+import fnmatch
 import logging
+import os
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from dataclasses import dataclass, field
 
 # Docling imports
 try:
     from docling.document_converter import DocumentConverter
-    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.base_models import ConversionStatus, InputFormat
     from docling.datamodel.pipeline_options import PdfPipelineOptions
     from docling.document_converter import PdfFormatOption
     DOCLING_AVAILABLE = True
@@ -24,7 +32,13 @@ except ImportError:
     DOCLING_AVAILABLE = False
     logging.warning("Docling not available. Install with: pip install docling")
 
-# Fallback to pypdf
+# Fallback to pypdfium2 (PDFium, much faster text extraction), then pypdf
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM_AVAILABLE = True
+except ImportError:
+    PYPDFIUM_AVAILABLE = False
+
 try:
     from pypdf import PdfReader
     PYPDF_AVAILABLE = True
@@ -34,8 +48,70 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Files parsed ahead per worker in iter_directory() (bounds documents held in memory)
+IN_FLIGHT_PER_WORKER = 2
+
+# Docling item class -> structured item type, filled in by _item_kind()
+_ITEM_KINDS: dict[type, str] = {}
 
-@dataclass
+
+def _item_kind(item_cls: type) -> str:
+    """Structured item type ("header", "table", "list" or "text") of a Docling item class."""
+    kind = _ITEM_KINDS.get(item_cls)
+    if kind is None:
+        name = item_cls.__name__
+        if 'SectionHeader' in name or 'Heading' in name or 'Title' in name:
+            kind = "header"
+        elif 'Table' in name:
+            kind = "table"
+        elif 'List' in name:
+            kind = "list"
+        else:
+            kind = "text"
+        _ITEM_KINDS[item_cls] = kind
+    return kind
+
+# Docling converters by use_ocr, shared by every PDFProcessor in the process
+# (building one and loading its models is the slow part of startup)
+_converters: dict[bool, Optional["DocumentConverter"]] = {}
+_converters_lock = threading.Lock()
+
+
+def _get_converter(use_ocr: bool) -> Optional["DocumentConverter"]:
+    """Get the shared Docling converter for use_ocr (None if it can't be built)."""
+    with _converters_lock:
+        if use_ocr not in _converters:
+            _converters[use_ocr] = _build_converter(use_ocr)
+        return _converters[use_ocr]
+
+
+def _build_converter(use_ocr: bool) -> Optional["DocumentConverter"]:
+    """Initialize a Docling converter with options."""
+    try:
+        # Configure PDF pipeline options
+        pipeline_options = PdfPipelineOptions()
+        pipeline_options.do_ocr = use_ocr
+        pipeline_options.do_table_structure = True
+        # Pre-downloaded models, if provided (avoids fetching them per machine/run)
+        artifacts_path = os.environ.get("DOCLING_ARTIFACTS_PATH")
+        if artifacts_path:
+            pipeline_options.artifacts_path = artifacts_path
+
+        converter = DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=pipeline_options
+                )
+            }
+        )
+        logger.info("Docling converter initialized")
+        return converter
+    except Exception as e:
+        logger.warning(f"Failed to initialize Docling: {e}")
+        return None
+
+
+@dataclass(slots=True)
 class StructuredItem:
     """A structured item extracted from a document."""
     item_type: str  # "header", "text", "table", "list"
@@ -45,7 +121,7 @@ class StructuredItem:
     section_path: list[str] = field(default_factory=list)  # ["כיסויים", "נזקי רכוש"]
 
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Content extracted from a single page."""
     page_num: int
@@ -57,7 +133,7 @@ class PageContent:
     structured_items: list[StructuredItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDocument:
     """Result of processing a PDF document."""
     filepath: str
@@ -67,7 +143,7 @@ class ProcessedDocument:
     total_chars: int
     has_tables: bool = False
     detected_headers: list[str] = field(default_factory=list)
-    processing_method: str = "docling"  # "docling", "pypdf", or "aspx"
+    processing_method: str = "docling"  # "docling", "pypdfium2", "pypdf", or "aspx"
     error: Optional[str] = None
     structured_items: list[StructuredItem] = field(default_factory=list)
     domain: Optional[str] = None  # Insurance domain (car, health, etc.)
@@ -77,6 +153,11 @@ class ProcessedDocument:
         """Get list of page texts for chunking."""
         return [p.text for p in self.pages]
 
+    def get_page_texts_iter(self) -> Iterator[str]:
+        """Yield page texts one at a time (no intermediate list)."""
+        for p in self.pages:
+            yield p.text
+
     def get_structured_text(self) -> str:
         """Get text with structure markers preserved."""
         parts = []
@@ -96,13 +177,13 @@ class ProcessedDocument:
 
 class PDFProcessor:
     """
-    Process PDF documents using Docling with pypdf fallback.
+    Process PDF documents using Docling with pypdfium2/pypdf fallback.
     
     Features:
     - Structure-aware parsing (tables, headers, lists)
     - Page-by-page extraction
     - Hebrew text support
-    - Automatic fallback to pypdf if Docling fails
+    - Automatic fallback to pypdfium2 (then pypdf) if Docling fails
     """
 
     def __init__(self, use_ocr: bool = False):
@@ -113,30 +194,7 @@ class PDFProcessor:
             use_ocr: Enable OCR for scanned PDFs (slower but more accurate)
         """
         self.use_ocr = use_ocr
-        self._converter = None
-        
-        if DOCLING_AVAILABLE:
-            self._init_docling()
-
-    def _init_docling(self):
-        """Initialize Docling converter with options."""
-        try:
-            # Configure PDF pipeline options
-            pipeline_options = PdfPipelineOptions()
-            pipeline_options.do_ocr = self.use_ocr
-            pipeline_options.do_table_structure = True
-            
-            self._converter = DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(
-                        pipeline_options=pipeline_options
-                    )
-                }
-            )
-            logger.info("Docling converter initialized")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Docling: {e}")
-            self._converter = None
+        self._converter = _get_converter(use_ocr) if DOCLING_AVAILABLE else None
 
     def process(self, filepath: str) -> ProcessedDocument:
         """
@@ -165,22 +223,27 @@ class PDFProcessor:
             try:
                 return self._process_with_docling(path)
             except Exception as e:
-                logger.warning(f"Docling failed for {path.name}: {e}, falling back to pypdf")
+                logger.warning(f"Docling failed for {path.name}: {e}, using fallback parser")
+
+        return self._process_fallback(path)
+
+    def _process_fallback(self, path: Path) -> ProcessedDocument:
+        """Process a PDF with pypdfium2, then pypdf (when Docling is unavailable or failed)."""
+        error = "No PDF processing library available"
+
+        if PYPDFIUM_AVAILABLE:
+            try:
+                return self._process_with_pypdfium(path)
+            except Exception as e:
+                logger.warning(f"pypdfium2 failed for {path.name}: {e}")
+                error = str(e)
 
-        # Fallback to pypdf
         if PYPDF_AVAILABLE:
             try:
                 return self._process_with_pypdf(path)
             except Exception as e:
                 logger.error(f"pypdf also failed for {path.name}: {e}")
-                return ProcessedDocument(
-                    filepath=str(path),
-                    filename=path.name,
-                    page_count=0,
-                    pages=[],
-                    total_chars=0,
-                    error=str(e)
-                )
+                error = str(e)
 
         return ProcessedDocument(
             filepath=str(path),
@@ -188,7 +251,7 @@ class PDFProcessor:
             page_count=0,
             pages=[],
             total_chars=0,
-            error="No PDF processing library available"
+            error=error
         )
 
     def _process_with_docling(self, path: Path) -> ProcessedDocument:
@@ -196,115 +259,87 @@ class PDFProcessor:
         logger.info(f"Processing with Docling: {path.name}")
 
         result = self._converter.convert(str(path))
-        doc = result.document
+        return self._docling_document(result.document, path)
 
+    def _docling_document(self, doc, path: Path) -> ProcessedDocument:
+        """Build a ProcessedDocument from a converted Docling document."""
         # Extract structured items per page
-        page_texts: dict[int, list[str]] = {}
-        page_has_tables: dict[int, bool] = {}
-        page_headers: dict[int, list[str]] = {}
-        page_structured_items: dict[int, list[StructuredItem]] = {}
+        page_texts: dict[int, list[str]] = defaultdict(list)
+        page_has_tables: dict[int, bool] = defaultdict(bool)
+        page_headers: dict[int, list[str]] = defaultdict(list)
+        page_structured_items: dict[int, list[StructuredItem]] = defaultdict(list)
         all_structured_items: list[StructuredItem] = []
 
         # Track current section hierarchy
         current_section_path: list[str] = []
 
+        # Pages normally appear in reading order; then page_texts is already sorted
+        last_page = 0
+        pages_in_order = True
+
+        def add_structured_item(item_type: str, text: str, page_no: int, level: int):
+            structured_item = StructuredItem(
+                item_type=item_type,
+                text=text,
+                page_num=page_no,
+                level=level,
+                section_path=current_section_path.copy(),
+            )
+            page_structured_items[page_no].append(structured_item)
+            all_structured_items.append(structured_item)
+
         for item, level in doc.iterate_items():
             # Get page number from provenance
             page_no = 1  # default
-            if hasattr(item, 'prov') and item.prov:
-                prov = item.prov[0] if isinstance(item.prov, list) else item.prov
-                if hasattr(prov, 'page_no'):
-                    page_no = prov.page_no
-
-            # Initialize page data
-            if page_no not in page_texts:
-                page_texts[page_no] = []
-                page_has_tables[page_no] = False
-                page_headers[page_no] = []
-                page_structured_items[page_no] = []
-
-            item_type = type(item).__name__
+            prov = getattr(item, 'prov', None)
+            if prov:
+                prov = prov[0] if isinstance(prov, list) else prov
+                page_no = getattr(prov, 'page_no', page_no)
+            if page_no < last_page:
+                pages_in_order = False
+            last_page = page_no
+
+            texts = page_texts[page_no]  # Every page with items gets a PageContent
+            item_kind = _item_kind(type(item))
+            text = getattr(item, 'text', None) or ""
+            if not text and item_kind != "table":
+                continue  # Only tables produce output without text
 
             # Handle different item types
-            if 'SectionHeader' in item_type or 'Heading' in item_type or 'Title' in item_type:
-                # Section header - update hierarchy
-                text = item.text if hasattr(item, 'text') and item.text else ""
-                if text:
-                    # Adjust section path based on level
-                    if level < len(current_section_path):
-                        current_section_path = current_section_path[:level]
-                    current_section_path.append(text)
-
-                    page_texts[page_no].append(f"\n## {text}\n")
-                    page_headers[page_no].append(text)
-
-                    structured_item = StructuredItem(
-                        item_type="header",
-                        text=text,
-                        page_num=page_no,
-                        level=level,
-                        section_path=current_section_path.copy(),
-                    )
-                    page_structured_items[page_no].append(structured_item)
-                    all_structured_items.append(structured_item)
-
-            elif 'Table' in item_type:
+            if item_kind == "header":
+                # Section header - update hierarchy. Interned: the same headers
+                # recur across documents and fill every item's section_path
+                text = sys.intern(text)
+                del current_section_path[level:]
+                current_section_path.append(text)
+
+                texts.append(f"\n## {text}\n")
+                page_headers[page_no].append(text)
+                add_structured_item("header", text, page_no, level)
+
+            elif item_kind == "table":
                 # Table - export as markdown
                 page_has_tables[page_no] = True
-                table_text = ""
                 if hasattr(item, 'export_to_markdown'):
                     try:
                         table_text = item.export_to_markdown()
                     except Exception:
                         table_text = "[טבלה]"
-                elif hasattr(item, 'text') and item.text:
-                    table_text = item.text
                 else:
-                    table_text = "[טבלה]"
-
-                page_texts[page_no].append(f"\n{table_text}\n")
+                    table_text = text or "[טבלה]"
 
-                structured_item = StructuredItem(
-                    item_type="table",
-                    text=table_text,
-                    page_num=page_no,
-                    level=level,
-                    section_path=current_section_path.copy(),
-                )
-                page_structured_items[page_no].append(structured_item)
-                all_structured_items.append(structured_item)
+                texts.append(f"\n{table_text}\n")
+                add_structured_item("table", table_text, page_no, level)
 
-            elif 'List' in item_type:
+            elif item_kind == "list":
                 # List item - preserve bullet structure
-                text = item.text if hasattr(item, 'text') and item.text else ""
-                if text:
-                    page_texts[page_no].append(f"• {text}")
-
-                    structured_item = StructuredItem(
-                        item_type="list",
-                        text=text,
-                        page_num=page_no,
-                        level=level,
-                        section_path=current_section_path.copy(),
-                    )
-                    page_structured_items[page_no].append(structured_item)
-                    all_structured_items.append(structured_item)
+                texts.append(f"• {text}")
+                add_structured_item("list", text, page_no, level)
 
             else:
                 # Regular text
-                text = item.text if hasattr(item, 'text') and item.text else ""
-                if text:
-                    page_texts[page_no].append(text)
-
-                    structured_item = StructuredItem(
-                        item_type="text",
-                        text=text,
-                        page_num=page_no,
-                        level=level,
-                        section_path=current_section_path.copy(),
-                    )
-                    page_structured_items[page_no].append(structured_item)
-                    all_structured_items.append(structured_item)
+                texts.append(text)
+                add_structured_item("text", text, page_no, level)
 
         # Build PageContent objects
         pages = []
@@ -312,7 +347,7 @@ class PDFProcessor:
         total_chars = 0
         has_any_tables = False
 
-        for page_no in sorted(page_texts.keys()):
+        for page_no in (page_texts if pages_in_order else sorted(page_texts)):
             text = "\n".join(page_texts[page_no])
             char_count = len(text)
             total_chars += char_count
@@ -346,6 +381,47 @@ class PDFProcessor:
             structured_items=all_structured_items,
         )
 
+    def _process_with_pypdfium(self, path: Path) -> ProcessedDocument:
+        """Process PDF using pypdfium2 (PDFium text extraction) as fallback."""
+        logger.info(f"Processing with pypdfium2: {path.name}")
+
+        pages = []
+        total_chars = 0
+
+        pdf = pdfium.PdfDocument(str(path))
+        try:
+            for i in range(len(pdf)):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                try:
+                    # PDFium ends lines with CRLF; pypdf/Docling text uses LF
+                    text = textpage.get_text_range().replace("\r\n", "\n")
+                finally:
+                    textpage.close()
+                    page.close()
+                char_count = len(text)
+                total_chars += char_count
+
+                pages.append(PageContent(
+                    page_num=i + 1,
+                    text=text,
+                    char_count=char_count,
+                    has_tables=False,  # No table detection without Docling
+                    has_headers=False,
+                ))
+        finally:
+            pdf.close()
+
+        return ProcessedDocument(
+            filepath=str(path),
+            filename=path.name,
+            page_count=len(pages),
+            pages=pages,
+            total_chars=total_chars,
+            has_tables=False,
+            processing_method="pypdfium2"
+        )
+
     def _process_with_pypdf(self, path: Path) -> ProcessedDocument:
         """Process PDF using pypdf as fallback."""
         logger.info(f"Processing with pypdf: {path.name}")
@@ -380,50 +456,202 @@ class PDFProcessor:
     def process_directory(
         self,
         directory: str,
-        pattern: str = "*.pdf"
+        pattern: str = "*.pdf",
+        max_workers: Optional[int] = None,
     ) -> list[ProcessedDocument]:
         """
         Process all PDFs in a directory.
 
+        Holds every document in memory; use iter_directory() to consume
+        documents as they complete.
+
         Args:
             directory: Path to directory containing PDFs
             pattern: Glob pattern for matching files
+            max_workers: Worker processes (None = CPU count, 1 = serial)
 
         Returns:
-            List of ProcessedDocument objects
+            List of ProcessedDocument objects, in file order
+        """
+        pdf_files = self._find_pdfs(directory, pattern)
+        by_path = {doc.filepath: doc for doc in self._iter_files(pdf_files, max_workers)}
+        return [by_path[str(pdf_path)] for pdf_path in pdf_files]
+
+    def iter_directory(
+        self,
+        directory: str,
+        pattern: str = "*.pdf",
+        max_workers: Optional[int] = None,
+    ) -> Iterator[ProcessedDocument]:
+        """
+        Process all PDFs in a directory, yielding each document as it completes.
+
+        At most IN_FLIGHT_PER_WORKER files per worker are parsed ahead, so
+        a consumer that indexes and drops each document keeps memory
+        bounded on large corpora.
+
+        Args:
+            directory: Path to directory containing PDFs
+            pattern: Glob pattern for matching files
+            max_workers: Worker processes (None = CPU count, 1 = serial)
+
+        Yields:
+            ProcessedDocument objects, in completion order
+        """
+        yield from self._iter_files(self._find_pdfs(directory, pattern), max_workers)
+
+    @staticmethod
+    def _find_pdfs(directory: str, pattern: str) -> dict[Path, int]:
+        """
+        Files in directory matching pattern, with their sizes (for scheduling).
+
+        Scans the directory once with os.scandir, so each file is stat'ed
+        once. Empty if the directory doesn't exist.
         """
         dir_path = Path(directory)
         if not dir_path.exists():
             logger.error(f"Directory not found: {directory}")
-            return []
+            return {}
 
-        pdf_files = list(dir_path.glob(pattern))
+        if "/" in pattern or os.sep in pattern:
+            # Multi-level patterns need glob
+            pdf_files = {p: p.stat().st_size for p in dir_path.glob(pattern)}
+        else:
+            with os.scandir(dir_path) as entries:
+                pdf_files = {
+                    dir_path / entry.name: entry.stat().st_size
+                    for entry in entries
+                    if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()
+                }
         logger.info(f"Found {len(pdf_files)} PDF files in {directory}")
+        return pdf_files
+
+    def _iter_files(
+        self, pdf_files: dict[Path, int], max_workers: Optional[int]
+    ) -> Iterator[ProcessedDocument]:
+        """
+        Process files in a process pool, yielding documents as they complete.
+
+        Files are started largest first, so a big PDF doesn't start last.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(pdf_files))
+        if workers <= 1:
+            for pdf_path in pdf_files:
+                yield self._process_logged(pdf_path, partial(self.process, str(pdf_path)))
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.use_ocr,),
+        ) as executor:
+            largest_first = iter(sorted(pdf_files, key=pdf_files.__getitem__, reverse=True))
+            in_flight = {
+                executor.submit(_process_pdf_worker, str(pdf_path)): pdf_path
+                for pdf_path in islice(largest_first, workers * IN_FLIGHT_PER_WORKER)
+            }
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pdf_path = in_flight.pop(future)
+                    next_path = next(largest_first, None)
+                    if next_path is not None:
+                        in_flight[executor.submit(_process_pdf_worker, str(next_path))] = next_path
+                    yield self._process_logged(pdf_path, future.result)
+
+    def process_directory_batched(
+        self,
+        directory: str,
+        pattern: str = "*.pdf",
+    ) -> list[ProcessedDocument]:
+        """
+        Process all PDFs in a directory with a single Docling convert_all().
+
+        Docling pipelines the batch internally, so model warm-up is paid
+        once. Files it fails on (or all files, without Docling) go through
+        the fallback parsers. Results are returned in file order.
 
-        results = []
-        for pdf_path in pdf_files:
+        Args:
+            directory: Path to directory containing PDFs
+            pattern: Glob pattern for matching files
+
+        Returns:
+            List of ProcessedDocument objects
+        """
+        pdf_files = self._find_pdfs(directory, pattern)
+        if not self._converter:
+            return [
+                self._process_logged(pdf_path, partial(self._process_fallback, pdf_path))
+                for pdf_path in pdf_files
+            ]
+
+        # Post-process each result as it arrives, so converted Docling
+        # documents aren't all held at once
+        processed = {}
+        for result in self._converter.convert_all(
+            [str(p) for p in pdf_files], raises_on_error=False
+        ):
+            path = Path(result.input.file)
+            ok = result.status in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS)
+            processed[path.resolve()] = self._process_logged(
+                path, partial(self._converted_document, result.document if ok else None, path)
+            )
+
+        return [
+            processed.get(pdf_path.resolve())
+            or self._process_logged(pdf_path, partial(self._converted_document, None, pdf_path))
+            for pdf_path in pdf_files
+        ]
+
+    def _converted_document(self, doc, path: Path) -> ProcessedDocument:
+        """ProcessedDocument for a convert_all() result (None = conversion failed)."""
+        if doc is not None:
             try:
-                doc = self.process(str(pdf_path))
-                results.append(doc)
-                logger.info(f"Processed {pdf_path.name}: {doc.page_count} pages, {doc.total_chars} chars")
+                return self._docling_document(doc, path)
             except Exception as e:
-                logger.error(f"Failed to process {pdf_path.name}: {e}")
-                results.append(ProcessedDocument(
-                    filepath=str(pdf_path),
-                    filename=pdf_path.name,
-                    page_count=0,
-                    pages=[],
-                    total_chars=0,
-                    error=str(e)
-                ))
+                logger.warning(f"Docling failed for {path.name}: {e}, using fallback parser")
+        else:
+            logger.warning(f"Docling failed for {path.name}, using fallback parser")
+        return self._process_fallback(path)
+
+    @staticmethod
+    def _process_logged(
+        pdf_path: Path, get_document: Callable[[], ProcessedDocument]
+    ) -> ProcessedDocument:
+        """Get a file's ProcessedDocument and log it; exceptions become an error document."""
+        try:
+            doc = get_document()
+            logger.info(f"Processed {pdf_path.name}: {doc.page_count} pages, {doc.total_chars} chars")
+            return doc
+        except Exception as e:
+            logger.error(f"Failed to process {pdf_path.name}: {e}")
+            return ProcessedDocument(
+                filepath=str(pdf_path),
+                filename=pdf_path.name,
+                page_count=0,
+                pages=[],
+                total_chars=0,
+                error=str(e)
+            )
 
-        return results
+
+# Per-process state for process_directory() workers (set by _init_worker)
+_worker_processor: Optional[PDFProcessor] = None
+
+
+def _init_worker(use_ocr: bool):
+    """Build the worker's PDFProcessor once, not per file."""
+    global _worker_processor
+    _worker_processor = PDFProcessor(use_ocr=use_ocr)
+
+
+def _process_pdf_worker(filepath: str) -> ProcessedDocument:
+    """Parse one PDF in a worker process."""
+    return _worker_processor.process(filepath)
 
 
 # Quick test
 if __name__ == "__main__":
-    import sys
-
     logging.basicConfig(level=logging.INFO)
 
     processor = PDFProcessor(use_ocr=False)
@@ -443,8 +671,10 @@ if __name__ == "__main__":
             print(doc.pages[0].text[:500] if doc.pages else "No content")
     else:
         # Process sample directory
-        docs = processor.process_directory("data/harel_pdfs/pdfs/")
-        print(f"\nProcessed {len(docs)} documents")
-        for doc in docs[:3]:
-            print(f"  - {doc.filename}: {doc.page_count} pages, {doc.total_chars} chars")
+        count = 0
+        for doc in processor.iter_directory("data/harel_pdfs/pdfs/"):
+            if count < 3:
+                print(f"  - {doc.filename}: {doc.page_count} pages, {doc.total_chars} chars")
+            count += 1
+        print(f"\nProcessed {count} documents")
 
@@ -8,13 +8,15 @@ The ToC enables:
 4. Filter search by topic
 """
 
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+import orjson
+
 from .topic_taxonomy import TopicTaxonomy
 
 logger = logging.getLogger(__name__)
@@ -61,7 +63,11 @@ class ToCBuilder:
         self.taxonomy = taxonomy or TopicTaxonomy()
         self.toc_path = Path(toc_path)
         self._toc: dict[str, ToCEntry] = {}
-        self._topic_chunks: dict[str, list[str]] = defaultdict(list)
+        # Chunk ids per topic; dicts as insertion-ordered sets (O(1) dedupe in add_chunk)
+        self._topic_chunks: dict[str, dict[str, None]] = defaultdict(dict)
+        # Chunk ids of each topic's subtree, cleared whenever _topic_chunks changes
+        self._subtree_chunks_cache: dict[str, frozenset[str]] = {}
+        self._dirty = True  # Chunks added since the last save()
 
         # Load existing ToC if available
         self._load()
@@ -70,33 +76,46 @@ class ToCBuilder:
         """Load existing ToC from file."""
         if self.toc_path.exists():
             try:
-                with open(self.toc_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._topic_chunks = defaultdict(list, data.get("topic_chunks", {}))
+                with open(self.toc_path, "rb") as f:
+                    data = orjson.loads(f.read())
+                    self._topic_chunks = defaultdict(dict, {
+                        topic_id: dict.fromkeys(chunk_ids)
+                        for topic_id, chunk_ids in data.get("topic_chunks", {}).items()
+                    })
+                    self._subtree_chunks_cache.clear()
                     logger.info(f"Loaded ToC with {len(self._topic_chunks)} topics")
             except Exception as e:
                 logger.warning(f"Failed to load ToC: {e}")
 
     def save(self):
-        """Save ToC to file."""
+        """Save ToC to file (skipped if no chunks were added since the last save)."""
+        if not self._dirty:
+            return
         self.toc_path.parent.mkdir(parents=True, exist_ok=True)
 
         toc_data = {
             "toc": self.generate(),
-            "topic_chunks": dict(self._topic_chunks),
+            "topic_chunks": {
+                topic_id: list(chunk_ids) for topic_id, chunk_ids in self._topic_chunks.items()
+            },
             "stats": self.get_stats(),
         }
 
-        with open(self.toc_path, "w", encoding="utf-8") as f:
-            json.dump(toc_data, f, ensure_ascii=False, indent=2)
+        # Write a temp file and rename it over the ToC, so a crash mid-write
+        # leaves the previous ToC intact (orjson emits UTF-8, like ensure_ascii=False)
+        tmp_path = self.toc_path.with_name(self.toc_path.name + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(toc_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.toc_path)
+        self._dirty = False
 
         logger.info(f"Saved ToC to {self.toc_path}")
 
     def add_chunk(self, chunk_id: str, topics: list[str]):
         """Add a chunk to the ToC under its topics."""
         for topic_id in topics:
-            if chunk_id not in self._topic_chunks[topic_id]:
-                self._topic_chunks[topic_id].append(chunk_id)
+            self._topic_chunks[topic_id][chunk_id] = None
+        self._subtree_chunks_cache.clear()
+        self._dirty = True
 
     def build_from_chunks(self, chunks: list[dict]):
         """Build ToC from a list of indexed chunks."""
@@ -112,42 +131,39 @@ class ToCBuilder:
 
     def generate(self) -> dict:
         """Generate the full ToC structure."""
-        toc = {}
+        return {root.id: self._entry_dict(root.id) for root in self.taxonomy.get_root_topics()}
 
-        for root in self.taxonomy.get_root_topics():
-            entry = self._build_entry(root.id)
-            toc[root.id] = entry.to_dict()
-
-        return toc
+    def _entry_dict(self, topic_id: str) -> dict:
+        """
+        Build the ToC entry dict (as ToCEntry.to_dict()) for a topic and its children.
 
-    def _build_entry(self, topic_id: str) -> ToCEntry:
-        """Build a ToC entry for a topic and its children."""
+        Emits the dicts directly in one pass instead of building ToCEntry
+        objects and then converting them.
+        """
         topic = self.taxonomy.get_topic(topic_id)
         if not topic:
-            return ToCEntry(id=topic_id, name_he="", name_en="")
+            return ToCEntry(id=topic_id, name_he="", name_en="").to_dict()
 
         # Get chunks for this topic
-        chunk_ids = self._topic_chunks.get(topic_id, [])
+        chunk_ids = list(self._topic_chunks.get(topic_id, ()))
 
-        # Build children
+        # Build children; count includes children
         children = {}
+        total_chunks = len(chunk_ids)
         for child in self.taxonomy.get_children(topic_id):
-            children[child.id] = self._build_entry(child.id)
+            child_entry = self._entry_dict(child.id)
+            children[child.id] = child_entry
+            total_chunks += child_entry["chunk_count"]
 
-        # Count includes children
-        total_chunks = len(chunk_ids)
-        for child_entry in children.values():
-            total_chunks += child_entry.chunk_count
-
-        return ToCEntry(
-            id=topic_id,
-            name_he=topic.name_he,
-            name_en=topic.name_en,
-            parent_id=topic.parent_id,
-            chunk_count=total_chunks,
-            chunk_ids=chunk_ids,
-            children=children,
-        )
+        return {
+            "id": topic_id,
+            "name_he": topic.name_he,
+            "name_en": topic.name_en,
+            "parent_id": topic.parent_id,
+            "chunk_count": total_chunks,
+            "chunk_ids": chunk_ids,
+            "children": children,
+        }
 
     def get_stats(self) -> dict:
         """Get ToC statistics."""
@@ -202,11 +218,22 @@ class ToCBuilder:
         include_children: bool = True
     ) -> list[str]:
         """Get all chunk IDs for a topic."""
-        chunks = list(self._topic_chunks.get(topic_id, []))
-
         if include_children:
+            return list(self._subtree_chunks(topic_id))
+        return list(self._topic_chunks.get(topic_id, ()))
+
+    def _subtree_chunks(self, topic_id: str) -> frozenset[str]:
+        """
+        Chunk IDs of a topic and all its descendants.
+
+        Memoized per topic, so get_stats() and print_toc() don't descend
+        the same subtrees again for every ancestor.
+        """
+        chunks = self._subtree_chunks_cache.get(topic_id)
+        if chunks is None:
+            subtree = set(self._topic_chunks.get(topic_id, ()))
             for child in self.taxonomy.get_children(topic_id):
-                chunks.extend(self.get_chunks_for_topic(child.id, include_children=True))
-
-        return list(set(chunks))  # Deduplicate
+                subtree.update(self._subtree_chunks(child.id))
+            chunks = self._subtree_chunks_cache[topic_id] = frozenset(subtree)
+        return chunks
 
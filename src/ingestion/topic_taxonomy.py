@@ -34,6 +34,10 @@ class Topic:
         return cls(**data)
 
 
+# Classification results kept per distinct text (boilerplate chunks repeat)
+CLASSIFY_CACHE_SIZE = 4096
+
+
 # Default taxonomy for Harel Insurance
 DEFAULT_TAXONOMY = {
     # ===== CAR INSURANCE =====
@@ -299,6 +303,8 @@ class TopicTaxonomy:
         """
         self.taxonomy_path = Path(taxonomy_path) if taxonomy_path else None
         self._topics: dict[str, Topic] = {}
+        self._keyword_index: Optional[tuple] = None
+        self._classify_cache: dict[str, tuple[str, ...]] = {}
         self._load_taxonomy()
 
     def _load_taxonomy(self):
@@ -314,6 +320,7 @@ class TopicTaxonomy:
 
         # Build parent-child relationships
         self._build_hierarchy()
+        self._keyword_index = None
 
     def _build_hierarchy(self):
         """Build parent-child relationships."""
@@ -370,28 +377,89 @@ class TopicTaxonomy:
         Returns:
             List of topic IDs that match, ordered by specificity (most specific first).
         """
+        return self._classify_cached(text, self._get_keyword_index())
+
+    def classify_texts(self, texts: list[str]) -> list[list[str]]:
+        """
+        Classify many texts (e.g. all chunks of a document) at once.
+
+        Returns:
+            One classify_text() result per input text.
+        """
+        index = self._get_keyword_index()
+        return [self._classify_cached(text, index) for text in texts]
+
+    def _classify_cached(self, text: str, index: tuple) -> list[str]:
+        """
+        Classify text, reusing the result for texts seen before.
+
+        Headers, footers and legal boilerplate produce identical chunks
+        across documents. The cache is simply emptied when it fills up.
+        """
+        topics = self._classify_cache.get(text)
+        if topics is None:
+            if len(self._classify_cache) >= CLASSIFY_CACHE_SIZE:
+                self._classify_cache.clear()
+            topics = self._classify_cache[text] = tuple(self._classify(text, *index))
+        return list(topics)
+
+    def _get_keyword_index(self) -> tuple:
+        """
+        Build (or reuse) the keyword -> topic index used for classification.
+
+        Keywords shared by several topics ("כיסוי", "תביעה", ...) are then
+        searched for once per text instead of once per topic.
+        """
+        if self._keyword_index is None:
+            # Cached results belong to the previous topic set
+            self._classify_cache = {}
+            topic_ids = list(self._topics)
+            keywords_he: dict[str, list[int]] = {}
+            keywords_en: dict[str, list[int]] = {}
+            for i, topic in enumerate(self._topics.values()):
+                for kw in topic.keywords_he:
+                    keywords_he.setdefault(kw, []).append(i)
+                for kw in topic.keywords_en:
+                    keywords_en.setdefault(kw.lower(), []).append(i)
+
+            # More specific topics (deeper in hierarchy) get priority
+            depths = [topic_id.count("/") for topic_id in topic_ids]
+            self._keyword_index = (
+                topic_ids,
+                depths,
+                list(keywords_he.items()),
+                list(keywords_en.items()),
+            )
+        return self._keyword_index
+
+    @staticmethod
+    def _classify(
+        text: str,
+        topic_ids: list[str],
+        depths: list[int],
+        keywords_he: list[tuple[str, list[int]]],
+        keywords_en: list[tuple[str, list[int]]],
+    ) -> list[str]:
+        """Score topics by matched keywords and order them by (depth, score)."""
+        scores: dict[int, int] = {}
+
+        # Check Hebrew keywords
+        for kw, topics in keywords_he:
+            if kw in text:
+                for i in topics:
+                    scores[i] = scores.get(i, 0) + 1
+
+        # Check English keywords
         text_lower = text.lower()
-        matches = []
+        for kw, topics in keywords_en:
+            if kw in text_lower:
+                for i in topics:
+                    scores[i] = scores.get(i, 0) + 1
 
-        for topic_id, topic in self._topics.items():
-            score = 0
-            # Check Hebrew keywords
-            for kw in topic.keywords_he:
-                if kw in text:
-                    score += 1
-            # Check English keywords
-            for kw in topic.keywords_en:
-                if kw.lower() in text_lower:
-                    score += 1
-
-            if score > 0:
-                # More specific topics (deeper in hierarchy) get priority
-                depth = topic_id.count("/")
-                matches.append((topic_id, score, depth))
-
-        # Sort by depth (descending) then score (descending)
-        matches.sort(key=lambda x: (x[2], x[1]), reverse=True)
-        return [m[0] for m in matches]
+        # Sort by depth (descending) then score (descending); ties keep taxonomy order
+        matches = sorted(scores)
+        matches.sort(key=lambda i: (depths[i], scores[i]), reverse=True)
+        return [topic_ids[i] for i in matches]
 
     def add_topic(self, topic: Topic) -> bool:
         """Add a new topic to the taxonomy."""
@@ -399,6 +467,7 @@ class TopicTaxonomy:
             return False
 
         self._topics[topic.id] = topic
+        self._keyword_index = None
 
         # Update parent's children list
         if topic.parent_id and topic.parent_id in self._topics:
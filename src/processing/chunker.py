@@ -9,7 +9,7 @@ Features:
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Callable
+from typing import Callable, Iterable, List, Optional
 import yaml
 from pathlib import Path
 
@@ -281,7 +281,7 @@ class AdaptiveChunker:
 
     def chunk_document(
         self,
-        pages: List[str],
+        pages: Iterable[str],
         doc_metadata: Optional[dict] = None,
         carry_context_across_pages: bool = True,
     ) -> List[dict]:
@@ -291,7 +291,8 @@ class AdaptiveChunker:
         Context summaries are carried across chunks (and optionally across pages).
 
         Args:
-            pages: List of page texts (index = page number - 1)
+            pages: Page texts in order (index = page number - 1); any
+                iterable, e.g. ProcessedDocument.get_page_texts_iter()
             doc_metadata: Optional metadata to include with each chunk
             carry_context_across_pages: If True, last chunk's summary carries to next page
 
@@ -301,8 +302,10 @@ class AdaptiveChunker:
         all_chunks = []
         doc_metadata = doc_metadata or {}
         previous_context = ""  # Context from previous chunk
+        total_pages = 0
 
         for page_num, page_text in enumerate(pages, start=1):
+            total_pages = page_num
             # Pass context from previous page/chunk
             page_chunks = self.chunk_page(
                 page_text,
@@ -312,7 +315,6 @@ class AdaptiveChunker:
 
             for chunk in page_chunks:
                 chunk["metadata"].update(doc_metadata)
-                chunk["metadata"]["total_pages"] = len(pages)
                 all_chunks.append(chunk)
 
             # Carry last chunk's context to next page
@@ -320,8 +322,9 @@ class AdaptiveChunker:
                 last_chunk = page_chunks[-1]
                 previous_context = self._generate_summary(last_chunk.get("raw_text", ""))
 
-        # Add global chunk index
+        # Add page total (known once pages are consumed) and global chunk index
         for i, chunk in enumerate(all_chunks):
+            chunk["metadata"]["total_pages"] = total_pages
             chunk["metadata"]["global_chunk_index"] = i
             chunk["metadata"]["total_chunks"] = len(all_chunks)
 
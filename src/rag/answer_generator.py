@@ -6,7 +6,7 @@ Uses LLM to synthesize answers from retrieved documents with source citations.
 
 import logging
 import os
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass, field
 
 from openai import OpenAI
@@ -114,6 +114,76 @@ class AnswerGenerator:
         Returns:
             GeneratedAnswer with answer text and citations
         """
+        messages, citations, context_chunks = self._build_messages(
+            question, context_results, max_context_chunks, conversation_history
+        )
+
+        response = self._client.chat.completions.create(
+            model=self.config.model,
+            messages=messages,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+        
+        answer_text = response.choices[0].message.content
+        
+        # Determine confidence based on context quality
+        confidence = self._assess_confidence(context_chunks)
+        
+        return GeneratedAnswer(
+            answer=answer_text,
+            citations=citations,
+            confidence=confidence,
+            context_used=len(context_chunks),
+        )
+
+    def generate_stream(
+        self,
+        question: str,
+        context_results: list,
+        max_context_chunks: int = 5,
+        conversation_history: Optional[list[dict]] = None,
+    ) -> Iterator[tuple[str, object]]:
+        """
+        Stream an answer from retrieved context.
+
+        Yields:
+            ("token", str) for each generated text delta, then
+            ("citation", Citation) for each source, then
+            ("final", confidence)
+        """
+        messages, citations, context_chunks = self._build_messages(
+            question, context_results, max_context_chunks, conversation_history
+        )
+
+        stream = self._client.chat.completions.create(
+            model=self.config.model,
+            messages=messages,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            stream=True,
+        )
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield "token", delta
+
+        for citation in citations:
+            yield "citation", citation
+
+        yield "final", self._assess_confidence(context_chunks)
+
+    def _build_messages(
+        self,
+        question: str,
+        context_results: list,
+        max_context_chunks: int,
+        conversation_history: Optional[list[dict]],
+    ) -> tuple[list[dict], list[Citation], list]:
+        """Build chat messages and citations from retrieved context."""
         # Build context string with structure information
         context_chunks = context_results[:max_context_chunks]
         context_parts = []
@@ -157,24 +227,7 @@ class AnswerGenerator:
 
         messages.append({"role": "user", "content": user_message})
 
-        response = self._client.chat.completions.create(
-            model=self.config.model,
-            messages=messages,
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens,
-        )
-        
-        answer_text = response.choices[0].message.content
-        
-        # Determine confidence based on context quality
-        confidence = self._assess_confidence(context_chunks)
-        
-        return GeneratedAnswer(
-            answer=answer_text,
-            citations=citations,
-            confidence=confidence,
-            context_used=len(context_chunks),
-        )
+        return messages, citations, context_chunks
 
     def _assess_confidence(self, context_chunks: list) -> str:
         """Assess confidence based on context quality."""
@@ -6,7 +6,7 @@ Combines hybrid retrieval, cross-encoder reranking, and answer generation.
 
 import logging
 import time
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass, field
 
 from ..retrieval import (
@@ -182,45 +182,9 @@ class RAGPipeline:
         start_time = time.time()
         use_rerank = use_reranker if use_reranker is not None else self.config.use_reranker
 
-        # Step 0: Auto domain classification (if enabled and no filter provided)
-        detected_domain = None
-        if domain_filter is None and self.taxonomy and self.config.use_auto_domain:
-            topics = self.taxonomy.classify_text(question)
-            if topics:
-                # Count domain occurrences to find most likely domain
-                domain_counts = {}
-                for topic in topics:
-                    domain = topic.split("/")[0]
-                    domain_counts[domain] = domain_counts.get(domain, 0) + 1
-
-                # Get domain with most topic matches
-                if domain_counts:
-                    detected_domain = max(domain_counts, key=domain_counts.get)
-                    domain_filter = detected_domain
-                    logger.info(f"Auto-detected domain: {detected_domain} (counts: {domain_counts})")
-
-        # Step 1: Hybrid retrieval
-        t0 = time.time()
-        candidates = self.retriever.search(
-            query=question,
-            top_k=self.config.retrieval_top_k,
-            domain_filter=domain_filter,
+        candidates, context_results, detected_domain, retrieval_time, rerank_time = self._retrieve(
+            question, domain_filter, use_rerank
         )
-        retrieval_time = (time.time() - t0) * 1000
-
-        # Step 2: Reranking (optional)
-        rerank_time = 0
-        if use_rerank and self.reranker and candidates:
-            t0 = time.time()
-            reranked = self.reranker.rerank(
-                query=question,
-                results=candidates,
-                top_k=self.config.rerank_top_k,
-            )
-            rerank_time = (time.time() - t0) * 1000
-            context_results = reranked
-        else:
-            context_results = candidates[:self.config.rerank_top_k]
 
         # Step 3: Answer generation
         t0 = time.time()
@@ -280,6 +244,88 @@ class RAGPipeline:
             verification_issues=verification_issues,
         )
 
+    def query_stream(
+        self,
+        question: str,
+        domain_filter: Optional[str] = None,
+        use_reranker: Optional[bool] = None,
+        conversation_history: Optional[list[dict]] = None,
+    ) -> Iterator[tuple[str, object]]:
+        """
+        Process a question and stream the answer as it is generated.
+
+        Retrieval and reranking run up front; generation is streamed. The
+        verification step is skipped since tokens are already sent to the
+        client by the time the full answer exists.
+
+        Yields:
+            ("token", str), ("citation", Citation), ("final", confidence)
+        """
+        use_rerank = use_reranker if use_reranker is not None else self.config.use_reranker
+
+        _, context_results, _, _, _ = self._retrieve(question, domain_filter, use_rerank)
+
+        yield from self.generator.generate_stream(
+            question=question,
+            context_results=context_results,
+            max_context_chunks=self.config.final_context_k,
+            conversation_history=conversation_history,
+        )
+
+    def _retrieve(
+        self,
+        question: str,
+        domain_filter: Optional[str],
+        use_rerank: bool,
+    ) -> tuple[list, list, Optional[str], float, float]:
+        """
+        Run domain detection, hybrid retrieval and reranking.
+
+        Returns:
+            (candidates, context_results, detected_domain, retrieval_time_ms, rerank_time_ms)
+        """
+        # Step 0: Auto domain classification (if enabled and no filter provided)
+        detected_domain = None
+        if domain_filter is None and self.taxonomy and self.config.use_auto_domain:
+            topics = self.taxonomy.classify_text(question)
+            if topics:
+                # Count domain occurrences to find most likely domain
+                domain_counts = {}
+                for topic in topics:
+                    domain = topic.split("/")[0]
+                    domain_counts[domain] = domain_counts.get(domain, 0) + 1
+
+                # Get domain with most topic matches
+                if domain_counts:
+                    detected_domain = max(domain_counts, key=domain_counts.get)
+                    domain_filter = detected_domain
+                    logger.info(f"Auto-detected domain: {detected_domain} (counts: {domain_counts})")
+
+        # Step 1: Hybrid retrieval
+        t0 = time.time()
+        candidates = self.retriever.search(
+            query=question,
+            top_k=self.config.retrieval_top_k,
+            domain_filter=domain_filter,
+        )
+        retrieval_time = (time.time() - t0) * 1000
+
+        # Step 2: Reranking (optional)
+        rerank_time = 0
+        if use_rerank and self.reranker and candidates:
+            t0 = time.time()
+            reranked = self.reranker.rerank(
+                query=question,
+                results=candidates,
+                top_k=self.config.rerank_top_k,
+            )
+            rerank_time = (time.time() - t0) * 1000
+            context_results = reranked
+        else:
+            context_results = candidates[:self.config.rerank_top_k]
+
+        return candidates, context_results, detected_domain, retrieval_time, rerank_time
+
     def query_simple(self, question: str, domain_filter: Optional[str] = None) -> str:
         """Simple query that returns just the answer text."""
         response = self.query(question, domain_filter)